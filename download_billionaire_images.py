@@ -58,6 +58,7 @@ def main():
     
     print("\nNote: The game will still work with placeholder graphics if you don't provide these files.")
     print("You can find free sound effects on websites like freesound.org.")
+    print("Once the files are in place, run 'python -m ui.bundle' to pack them into assets.bundle for faster startup.")
     
     return 0
 
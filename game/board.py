@@ -0,0 +1,245 @@
+"""
+Board layout module that compiles snakes and ladders into flat lookup tables
+
+Layouts can also be loaded from JSON or TOML files, for example:
+
+    name = "Quick"
+    size = 8
+    seed = 3
+
+    [snakes]
+    27 = 5
+
+    [ladders]
+    3 = 22
+
+    [billionaire_snakes]
+    27 = "elon_musk.png"
+"""
+import os
+import json
+from array import array
+from ui.constants import BOARD_SIZE, SNAKES, LADDERS, BILLIONAIRE_SNAKES
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
+
+# Jump types stored in the resolved-type table
+JUMP_NONE = 0
+JUMP_SNAKE = 1
+JUMP_LADDER = 2
+
+# Names returned by Player.check_snake_or_ladder for each jump type
+JUMP_NAMES = (None, "snake", "ladder")
+
+# Directory searched for board files
+BOARDS_DIR = "boards"
+
+# Largest grid whose squares still fit in the "H" jump table
+MAX_BOARD_SIZE = 255
+
+# Keys allowed in a board file
+BOARD_KEYS = {"name", "size", "seed", "snakes", "ladders", "billionaire_snakes"}
+
+class BoardLayout:
+    """Snakes and ladders compiled once into per-square lookup tables
+
+    final[square] is the square a player ends on after landing on square and
+    jump_type[square] says whether a snake or ladder took them there, so hot
+    loops resolve a landing with a single index instead of dict lookups.
+    The seed picks the shape of the snake curves drawn for this board.
+    """
+    def __init__(self, snakes=SNAKES, ladders=LADDERS, size=BOARD_SIZE, seed=0,
+                 name="Classic", billionaire_snakes=BILLIONAIRE_SNAKES, path=None):
+        self.name = name
+        self.path = path  # File the layout was loaded from, if any
+        self.size = size
+        self.seed = seed
+        self.last_square = size * size
+        self.snakes = dict(snakes)
+        self.ladders = dict(ladders)
+        self.billionaire_snakes = dict(billionaire_snakes)
+
+        self.validate()
+
+        # Index 0 is unused so squares can be looked up directly
+        self.final = array("H", range(self.last_square + 1))
+        self.jump_type = array("B", bytes(self.last_square + 1))
+        for head, tail in self.snakes.items():
+            self.final[head] = tail
+            self.jump_type[head] = JUMP_SNAKE
+        for bottom, top in self.ladders.items():
+            self.final[bottom] = top
+            self.jump_type[bottom] = JUMP_LADDER
+
+        self.check_finishable()
+
+    def validate(self):
+        """Raise ValueError if the snakes and ladders do not form a valid board"""
+        if not 2 <= self.size <= MAX_BOARD_SIZE:
+            raise ValueError(f"Board size {self.size} is outside 2-{MAX_BOARD_SIZE}")
+        
+        for name, jumps, going_up in (("Snake", self.snakes, False), ("Ladder", self.ladders, True)):
+            for start, end in jumps.items():
+                # Start squares exclude 1 (never landed on) and the finish
+                if not 1 < start < self.last_square or not 1 <= end <= self.last_square:
+                    raise ValueError(f"{name} {start}->{end} is outside squares 1-{self.last_square}")
+                if (end > start) != going_up or end == start:
+                    direction = "up" if going_up else "down"
+                    raise ValueError(f"{name} {start}->{end} must go {direction}")
+
+        overlap = set(self.snakes) & set(self.ladders)
+        if overlap:
+            raise ValueError(f"Squares {sorted(overlap)} start both a snake and a ladder")
+
+        # Landings resolve with a single jump, so an end square may not start
+        # another snake or ladder (this also rules out cycles)
+        starts = {**self.snakes, **self.ladders}
+        for start, end in starts.items():
+            if end in starts:
+                square, seen = end, {start}
+                while square in starts and square not in seen:
+                    seen.add(square)
+                    square = starts[square]
+                if square in seen:
+                    raise ValueError(f"Square {start} is part of a snake/ladder cycle")
+                raise ValueError(f"Square {end} ends one snake/ladder and starts another")
+
+        missing = set(self.billionaire_snakes) - set(self.snakes)
+        if missing:
+            raise ValueError(f"Billionaire snakes {sorted(missing)} have no snake head")
+
+    def check_finishable(self):
+        """Raise ValueError if a player can get stuck where the last square is out of reach"""
+        last_square = self.last_square
+        moves = [
+            {self.final[min(square + roll, last_square)] for roll in range(1, 7)}
+            for square in range(last_square)
+        ]
+
+        # Squares a player can reach from the start
+        reachable = {1}
+        stack = [1]
+        while stack:
+            for square in moves[stack.pop()]:
+                if square not in reachable and square != last_square:
+                    reachable.add(square)
+                    stack.append(square)
+
+        # Squares the last square can still be reached from
+        sources = [[] for _ in range(last_square + 1)]
+        for square in reachable:
+            for target in moves[square]:
+                sources[target].append(square)
+        finishable = {last_square}
+        stack = [last_square]
+        while stack:
+            for square in sources[stack.pop()]:
+                if square not in finishable:
+                    finishable.add(square)
+                    stack.append(square)
+
+        trapped = reachable - finishable
+        if trapped:
+            raise ValueError(f"Players on squares {sorted(trapped)[:10]} can never reach square {last_square}")
+
+    def resolve(self, square):
+        """Get the final square and jump name for a landing square"""
+        return self.final[square], JUMP_NAMES[self.jump_type[square]]
+
+    @classmethod
+    def from_dict(cls, data, path=None):
+        """Build a layout from parsed board file data
+
+        Square numbers may be strings, as JSON and TOML keys always are.
+        """
+        unknown = set(data) - BOARD_KEYS
+        if unknown:
+            raise ValueError(f"Unknown board keys: {', '.join(sorted(unknown))}")
+
+        def squares(key, value_type=int):
+            try:
+                return {int(start): value_type(end) for start, end in data.get(key, {}).items()}
+            except (AttributeError, TypeError, ValueError):
+                raise ValueError(f"'{key}' must map square numbers to {value_type.__name__} values")
+
+        try:
+            size = int(data.get("size", BOARD_SIZE))
+            seed = int(data.get("seed", 0))
+        except (TypeError, ValueError):
+            raise ValueError("'size' and 'seed' must be integers")
+
+        default_name = os.path.splitext(os.path.basename(path))[0] if path else "Custom"
+        return cls(
+            snakes=squares("snakes"),
+            ladders=squares("ladders"),
+            size=size,
+            seed=seed,
+            name=str(data.get("name", default_name)),
+            billionaire_snakes=squares("billionaire_snakes", str),
+            path=path
+        )
+
+# Board built from the constants in ui/constants.py
+DEFAULT_BOARD = BoardLayout()
+
+# Errors raised while reading or parsing a board file
+READ_ERRORS = (OSError, json.JSONDecodeError) + ((tomllib.TOMLDecodeError,) if tomllib else ())
+
+# Compiled layouts by file path, with the modification time they were read at
+BOARD_CACHE = {}
+
+def load_board(path):
+    """Load, validate and compile a board file (.json or .toml)
+
+    Layouts are cached by path and only re-read when the file changes, so
+    switching back to a board reuses its jump tables and render geometry.
+    Raises ValueError for unreadable or invalid boards.
+    """
+    path = os.path.abspath(path)
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError as e:
+        raise ValueError(f"Cannot read board file {path}: {e}")
+
+    cached = BOARD_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    extension = os.path.splitext(path)[1].lower()
+    try:
+        if extension == ".json":
+            with open(path) as f:
+                data = json.load(f)
+        elif extension == ".toml":
+            if tomllib is None:
+                raise ValueError("TOML boards need Python 3.11 or newer")
+            with open(path, "rb") as f:
+                data = tomllib.load(f)
+        else:
+            raise ValueError(f"Board files must be .json or .toml, not {extension or 'no extension'}")
+    except READ_ERRORS as e:
+        raise ValueError(f"Cannot read board file {path}: {e}")
+
+    if not isinstance(data, dict):
+        raise ValueError(f"Board file {path} must contain a table of settings")
+    try:
+        layout = BoardLayout.from_dict(data, path)
+    except ValueError as e:
+        raise ValueError(f"{os.path.basename(path)}: {e}")
+
+    BOARD_CACHE[path] = (mtime, layout)
+    return layout
+
+def list_boards(directory=BOARDS_DIR):
+    """Get the board files in a directory, sorted by name"""
+    try:
+        names = sorted(os.listdir(directory))
+    except OSError:
+        return []
+    return [
+        os.path.join(directory, name) for name in names
+        if os.path.splitext(name)[1].lower() in (".json", ".toml")
+    ]
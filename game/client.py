@@ -0,0 +1,129 @@
+"""
+Loopback client simulator for the multiplayer server
+
+Usage: python -m game.client --rooms 1000 --players 2
+       python -m game.client --host 127.0.0.1 --port 8765 --rooms 10
+
+Without --port a server is started in-process on a free loopback port, so
+a whole fleet of bot clients can play against it with no setup.
+"""
+import sys
+import json
+import time
+import asyncio
+import argparse
+from game.server import GameServer, MAX_LINE
+
+class GameClient:
+    """One JSON-lines connection to a game server"""
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, host="127.0.0.1", port=None):
+        """Open a connection to the server"""
+        reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE * 64)
+        return cls(reader, writer)
+
+    async def send(self, message):
+        """Send one message"""
+        self.writer.write((json.dumps(message, separators=(",", ":")) + "\n").encode())
+        await self.writer.drain()
+
+    async def receive(self):
+        """Wait for the next message; None once the server hangs up"""
+        line = await self.reader.readline()
+        return json.loads(line) if line else None
+
+    async def close(self):
+        """Close the connection"""
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+async def play_bot(host, port, room=None, players=2, name=None):
+    """Join a room and roll on every turn until the game ends
+
+    Returns the final state message, or None if the connection dropped.
+    """
+    client = await GameClient.connect(host, port)
+    try:
+        message = {"type": "join", "players": players}
+        if room is not None:
+            message["room"] = room
+        if name is not None:
+            message["name"] = name
+        await client.send(message)
+
+        seat = None
+        while True:
+            message = await client.receive()
+            if message is None:
+                return None
+            kind = message["type"]
+            if kind == "joined":
+                seat = message["seat"]
+            elif kind == "error":
+                raise RuntimeError(message["message"])
+            elif kind == "state":
+                if message["status"] == "over":
+                    return message
+                if message["status"] == "playing" and message["turn"] == seat:
+                    await client.send({"type": "roll"})
+    finally:
+        await client.close()
+
+async def simulate(rooms, players=2, host="127.0.0.1", port=None, board=None):
+    """Fill rooms with bots that play every game to the end
+
+    Starts a server on a free loopback port unless port is given.
+    Returns the final state of every game.
+    """
+    server = None
+    if port is None:
+        server = GameServer(board) if board is not None else GameServer()
+        await server.start(host, 0)
+        port = server.port
+    try:
+        bots = [
+            play_bot(host, port, f"sim-{room}", players, f"bot-{room}-{seat}")
+            for room in range(rooms)
+            for seat in range(players)
+        ]
+        results = await asyncio.gather(*bots)
+    finally:
+        if server is not None:
+            await server.close()
+    # Every bot in a room gets the same final state; keep one per room
+    return results[::players]
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Play bot games against a multiplayer server")
+    parser.add_argument("--host", default="127.0.0.1", help="server address")
+    parser.add_argument("--port", type=int, help="server port (default: start a server in-process)")
+    parser.add_argument("--rooms", type=int, default=100, help="number of games to play at once")
+    parser.add_argument("--players", type=int, default=2, help="bots per room")
+    return parser.parse_args()
+
+def main():
+    """Run the bot simulation and summarise it"""
+    args = parse_args()
+    start = time.perf_counter()
+    results = asyncio.run(simulate(args.rooms, args.players, args.host, args.port))
+    elapsed = time.perf_counter() - start
+
+    finished = [result for result in results if result is not None and result["winner"] is not None]
+    wins = [0] * args.players
+    for result in finished:
+        wins[result["winner"]] += 1
+    print(f"Played {len(finished)}/{args.rooms} games with {args.players} bots each in {elapsed:.2f}s")
+    for seat, count in enumerate(wins):
+        print(f"  Seat {seat + 1}: {count} wins")
+    return 0 if len(finished) == args.rooms else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
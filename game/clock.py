@@ -0,0 +1,61 @@
+"""
+Clocks and fixed-timestep helper for driving the game logic
+"""
+import time
+from ui.constants import LOGIC_TICK
+
+class SystemClock:
+    """Clock that follows real (monotonic) time"""
+    def now(self):
+        """Get the current time in seconds"""
+        return time.monotonic()
+
+    def advance(self, dt):
+        """Real time advances on its own, so this does nothing"""
+        pass
+
+class ManualClock:
+    """Clock that only moves when advanced, for simulated or headless time"""
+    def __init__(self, start=0.0):
+        self.time = start
+
+    def now(self):
+        """Get the current time in seconds"""
+        return self.time
+
+    def advance(self, dt):
+        """Move the clock forward by dt seconds"""
+        self.time += dt
+
+class FixedTimestep:
+    """Turns elapsed clock time into a whole number of fixed logic ticks
+
+    Leftover time is carried to the next frame, and alpha says how far the
+    renderer is between the last two ticks so it can interpolate.
+    """
+    def __init__(self, clock, step=LOGIC_TICK, max_steps=5):
+        self.clock = clock
+        self.step = step
+        self.max_steps = max_steps  # Limit catch-up after a long stall
+        self.last_time = clock.now()
+        self.accumulator = 0.0
+
+    def advance(self):
+        """Get the number of logic ticks to run for the time elapsed since the last call"""
+        now = self.clock.now()
+        self.accumulator += now - self.last_time
+        self.last_time = now
+
+        steps = int(self.accumulator / self.step)
+        if steps > self.max_steps:
+            # Drop the time we cannot catch up on instead of spiralling
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step
+        return steps
+
+    @property
+    def alpha(self):
+        """Fraction of a tick elapsed since the last logic tick"""
+        return self.accumulator / self.step
@@ -0,0 +1,88 @@
+"""
+Headless game engine for playing games without pygame or animation delays
+"""
+import random
+from game.board import DEFAULT_BOARD, JUMP_NAMES, JUMP_SNAKE
+from game.players import PlayerStore
+
+class GameEngine:
+    """Synchronous game engine that plays complete turns in a single call
+
+    Player state is kept in a PlayerStore, so games with thousands of
+    players cost a few arrays rather than a Player object per seat. Rolls
+    come from a private RNG, so the same seed plays the same games.
+    """
+    def __init__(self, num_players=2, board=DEFAULT_BOARD, seed=None):
+        self.board = board
+        self.rng = random.Random(seed)
+        self.players = PlayerStore(num_players)
+        self.stats = self.players.stats
+        self.current_player_idx = 0
+        self.winner = None
+        self.turns = 0
+
+    def reset(self):
+        """Reset the engine for a new game"""
+        self.players.reset()
+        self.current_player_idx = 0
+        self.winner = None
+        self.turns = 0
+
+    def play_turn(self):
+        """Play one turn for the current player and return what happened"""
+        if self.winner is not None:
+            return None
+
+        seat = self.current_player_idx
+        players = self.players
+        board = self.board
+
+        # Roll and move straight to the landing square
+        roll = self.rng.randint(1, 6)
+        landed = min(players.positions[seat] + roll, board.last_square)
+
+        # Follow a snake or ladder if the player landed on one
+        position = board.final[landed]
+        jump_type = board.jump_type[landed]
+        if jump_type:
+            self.stats["snakes" if jump_type == JUMP_SNAKE else "ladders"][seat] += 1
+
+        players.positions[seat] = position
+        players.last_rolls[seat] = roll
+        self.stats["moves"][seat] += 1
+        if roll == 6:
+            self.stats["sixes"][seat] += 1
+        self.turns += 1
+
+        # Check if player has won, otherwise pass the turn on
+        if position == board.last_square:
+            self.winner = seat
+        else:
+            self.current_player_idx = (seat + 1) % len(players)
+
+        return {
+            "player": seat,
+            "roll": roll,
+            "landed": landed,
+            "position": position,
+            "jump": JUMP_NAMES[jump_type]
+        }
+
+    def play_game(self):
+        """Play turns until a player wins and return the winner"""
+        while self.winner is None:
+            self.play_turn()
+        return self.winner
+
+    def get_winner(self):
+        """Get the winner of the game"""
+        return self.winner
+
+def play_games(num_games, num_players=2, board=DEFAULT_BOARD, seed=None):
+    """Play several headless games and return the winner of each"""
+    engine = GameEngine(num_players, board, seed)
+    winners = []
+    for _ in range(num_games):
+        engine.reset()
+        winners.append(engine.play_game())
+    return winners
@@ -0,0 +1,95 @@
+"""
+Append-only game event stream and the views derived from it
+"""
+from collections import namedtuple
+from game.players import STAT_KEYS
+
+# Event kinds
+ROLLED = "rolled"  # value is the roll
+MOVED = "moved"  # value is the square the roll landed on
+JUMPED = "jumped"  # value is the square a snake or ladder took the player to
+WON = "won"  # value is the finishing square
+
+GameEvent = namedtuple("GameEvent", ["kind", "player", "value"])
+
+class GameStats:
+    """Per-player counters and positions derived from events one at a time"""
+    __slots__ = ("counts", "positions", "rolls")
+
+    def __init__(self, num_players, counts=None, positions=None, rolls=0):
+        self.counts = counts or {key: [0] * num_players for key in STAT_KEYS}
+        self.positions = positions or [1] * num_players
+        self.rolls = rolls  # Rolls made by all players together
+
+    def __getitem__(self, key):
+        return self.counts[key]
+
+    def apply(self, event):
+        """Update the counters for one event"""
+        kind, player, value = event
+        if kind == ROLLED:
+            self.rolls += 1
+            if value == 6:
+                self.counts["sixes"][player] += 1
+        elif kind == MOVED:
+            self.counts["moves"][player] += 1
+            self.positions[player] = value
+        elif kind == JUMPED:
+            key = "snakes" if value < self.positions[player] else "ladders"
+            self.counts[key][player] += 1
+            self.positions[player] = value
+
+    def copy(self):
+        """Get an independent copy of the counters"""
+        counts = {key: list(values) for key, values in self.counts.items()}
+        return GameStats(len(self.positions), counts, list(self.positions), self.rolls)
+
+    @classmethod
+    def from_events(cls, events, num_players):
+        """Rebuild the counters from scratch by replaying every event"""
+        stats = cls(num_players)
+        for event in events:
+            stats.apply(event)
+        return stats
+
+class EventLog:
+    """Append-only chain of (event, previous) pairs with incrementally derived stats"""
+    def __init__(self, num_players):
+        self.num_players = num_players
+        self.head = None
+        self.length = 0
+        self.stats = GameStats(num_players)
+        self.listeners = []  # Called with each new event
+
+    def __len__(self):
+        return self.length
+
+    def append(self, event):
+        """Record an event and update the derived views"""
+        self.head = (event, self.head)
+        self.length += 1
+        self.stats.apply(event)
+        for listener in self.listeners:
+            listener(event)
+
+    def __iter__(self):
+        """Iterate over the events, oldest first"""
+        events = []
+        node = self.head
+        while node is not None:
+            events.append(node[0])
+            node = node[1]
+        return reversed(events)
+
+    def last(self):
+        """Get the most recent event, or None"""
+        return self.head[0] if self.head is not None else None
+
+    def snapshot(self):
+        """Capture the log and its stats"""
+        return (self.head, self.length, self.stats.copy())
+
+    def restore(self, snapshot):
+        """Return the log and its stats to a snapshot"""
+        self.head, self.length, stats = snapshot
+        self.stats = stats.copy()
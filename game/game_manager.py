@@ -1,15 +1,21 @@
 """
 Game Manager module for handling game logic
 """
+import os
 import random
-import time
-import pygame
-from ui.constants import SNAKES, LADDERS, PLAYER_TYPES, GAME_STATES
+from ui.constants import PLAYER_TYPES, GAME_STATES, LOGIC_TICK, ROLL_DELAY, JUMP_DELAY
+from game.board import DEFAULT_BOARD, JUMP_NAMES
+from game.clock import ManualClock
+from game.replay import ReplayLog
+from game.events import EventLog, GameEvent, ROLLED, MOVED, JUMPED, WON
 
 class Player:
     """Player class representing a player in the game"""
-    def __init__(self, player_id, player_type=PLAYER_TYPES["HUMAN"]):
+    __slots__ = ("id", "board", "position", "type", "target_position", "is_moving", "has_won", "last_roll")
+    
+    def __init__(self, player_id, player_type=PLAYER_TYPES["HUMAN"], board=DEFAULT_BOARD):
         self.id = player_id
+        self.board = board
         self.position = 1  # Start at position 1
         self.type = player_type
         self.target_position = 1  # For animation
@@ -25,14 +31,14 @@ class Player:
         self.has_won = False
         self.last_roll = 0
         
-    def roll_dice(self):
-        """Roll the dice and return the result"""
-        self.last_roll = random.randint(1, 6)
+    def roll_dice(self, rng=random):
+        """Roll the dice with rng and return the result"""
+        self.last_roll = rng.randint(1, 6)
         return self.last_roll
     
     def move(self, steps):
         """Set target position for movement"""
-        self.target_position = min(self.position + steps, 100)
+        self.target_position = min(self.position + steps, self.board.last_square)
         self.is_moving = True
         
     def update_position(self):
@@ -41,44 +47,125 @@ class Player:
         self.is_moving = False
         
         # Check if player has won
-        if self.position == 100:
+        if self.position == self.board.last_square:
             self.has_won = True
             return True
         return False
     
     def check_snake_or_ladder(self):
         """Check if player landed on a snake or ladder and update position"""
-        if self.position in SNAKES:
-            self.target_position = SNAKES[self.position]
+        jump_type = self.board.jump_type[self.position]
+        if jump_type:
+            self.target_position = self.board.final[self.position]
             self.is_moving = True
-            return "snake"
-        elif self.position in LADDERS:
-            self.target_position = LADDERS[self.position]
-            self.is_moving = True
-            return "ladder"
+            return JUMP_NAMES[jump_type]
         return None
 
 class GameManager:
     """Game Manager class for handling game logic"""
-    def __init__(self):
-        self.players = [Player(0), Player(1)]
+    def __init__(self, num_players=2, board=DEFAULT_BOARD, clock=None, turbo=False, seed=None, playback=None):
+        self.board = board
+        self.clock = clock if clock is not None else ManualClock()
+        self.turbo = turbo
+        self.roll_delay = 0.0 if turbo else ROLL_DELAY
+        self.jump_delay = 0.0 if turbo else JUMP_DELAY
+        self.players = [Player(i, board=board) for i in range(num_players)]
         self.current_player_idx = 0
         self.game_state = GAME_STATES["IDLE"]
         self.last_state_change = 0
         self.winner = None
+        self.playback = playback
+        self.start_game(playback.seed if playback is not None else seed)
+        
+    def start_game(self, seed=None):
+        """Seed the game RNG and start a new event log (a fresh seed if None)"""
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), "little")
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.events = EventLog(len(self.players))
+        
+    @property
+    def replay(self):
+        """Get the replay log of the game so far, rebuilt from the rolled events"""
+        rolls = bytes(event.value for event in self.events if event.kind == ROLLED)
+        return ReplayLog(self.seed, len(self.players), self.board, rolls)
+        
+    @property
+    def stats(self):
+        """Per-player moves, ladders, snakes and sixes derived from the events"""
+        return self.events.stats
+        
+    def emit(self, kind, player, value):
+        """Record a game event"""
+        self.events.append(GameEvent(kind, player.id, value))
         
-    def reset_game(self, game_mode="human_vs_ai"):
-        """Reset the game with the specified mode"""
-        self.players[0].reset()
-        self.players[1].reset()
+    def snapshot(self):
+        """Capture the full game state"""
+        return {
+            "board": self.board,
+            "players": [
+                (p.position, p.type, p.target_position, p.is_moving, p.has_won, p.last_roll)
+                for p in self.players
+            ],
+            "current_player_idx": self.current_player_idx,
+            "game_state": self.game_state,
+            "state_age": self.clock.now() - self.last_state_change,
+            "winner": self.winner,
+            "seed": self.seed,
+            "rng": self.rng.getstate(),
+            "events": (self.events, self.events.snapshot())
+        }
         
-        # Always set player 2 as AI
-        self.players[1].type = PLAYER_TYPES["AI"]
+    def restore(self, snapshot):
+        """Return to a state captured by snapshot()"""
+        if snapshot["board"] is not self.board or len(snapshot["players"]) != len(self.players):
+            raise ValueError("Snapshot is from a game on a different board or with different players")
+        
+        for player, state in zip(self.players, snapshot["players"]):
+            (player.position, player.type, player.target_position,
+             player.is_moving, player.has_won, player.last_roll) = state
+        self.current_player_idx = snapshot["current_player_idx"]
+        self.game_state = snapshot["game_state"]
+        self.last_state_change = self.clock.now() - snapshot["state_age"]
+        self.winner = snapshot["winner"]
+        self.seed = snapshot["seed"]
+        self.rng.setstate(snapshot["rng"])
+        events, events_snapshot = snapshot["events"]
+        self.events = events
+        self.events.restore(events_snapshot)
+        
+    def reset_game(self, game_mode="human_vs_ai", seed=None):
+        """Reset the game with the specified mode and a new seed"""
+        for player in self.players:
+            player.reset()
+        
+        # The first player is human and everyone else is AI (all AI in playback)
+        for player in self.players[1:]:
+            player.type = PLAYER_TYPES["AI"]
+        if self.playback is not None:
+            self.players[0].type = PLAYER_TYPES["AI"]
             
         self.current_player_idx = 0
         self.game_state = GAME_STATES["IDLE"]
         self.last_state_change = 0
         self.winner = None
+        self.start_game(self.playback.seed if self.playback is not None else seed)
+        
+    def set_board(self, board):
+        """Switch to a different board layout and start a new game on it"""
+        self.board = board
+        for player in self.players:
+            player.board = board
+        self.reset_game()
+        
+    def set_playback(self, playback):
+        """Replay a recorded game (or stop replaying if None) from the start"""
+        self.playback = playback
+        if playback is not None and playback.board is not self.board:
+            self.set_board(playback.board)
+        else:
+            self.reset_game()
         
     def get_current_player(self):
         """Get the current player"""
@@ -95,11 +182,19 @@ class GameManager:
             return None
             
         player = self.get_current_player()
-        roll_result = player.roll_dice()
+        if self.playback is not None:
+            # Replay the recorded roll, or stop once the recording runs out
+            rolls = self.events.stats.rolls
+            if rolls >= len(self.playback):
+                return None
+            roll_result = player.last_roll = self.playback.rolls[rolls]
+        else:
+            roll_result = player.roll_dice(self.rng)
+        self.emit(ROLLED, player, roll_result)
         
         # Set game state to rolling
         self.game_state = GAME_STATES["ROLLING"]
-        self.last_state_change = time.time()
+        self.last_state_change = self.clock.now()
         
         # Schedule the move after a delay
         return roll_result
@@ -112,21 +207,28 @@ class GameManager:
         player.move(player.last_roll)
         self.game_state = GAME_STATES["MOVING"]
         
-    def update(self):
-        """Update game state"""
+    def update(self, dt=LOGIC_TICK):
+        """Advance the game clock by dt seconds and update game state"""
+        self.clock.advance(dt)
         player = self.get_current_player()
         
         # Handle state transitions
-        if self.game_state == GAME_STATES["ROLLING"]:
+        if self.game_state == GAME_STATES["IDLE"]:
+            # AI players roll by themselves, including an AI first player
+            if player.type == PLAYER_TYPES["AI"]:
+                self.roll_dice()
+                
+        elif self.game_state == GAME_STATES["ROLLING"]:
             # Wait for rolling animation to complete
-            if time.time() - self.last_state_change > 1.0:
+            if self.clock.now() - self.last_state_change >= self.roll_delay:
                 self.move_player()
                 
         elif self.game_state == GAME_STATES["MOVING"]:
             # Check if player has reached target position
-            if not player.is_moving:
+            if not player.is_moving or self.turbo:
                 # Update player position
                 player.update_position()
+                self.emit(MOVED, player, player.position)
                 
                 # Check if player landed on a snake or ladder
                 result = player.check_snake_or_ladder()
@@ -134,12 +236,13 @@ class GameManager:
                 if result:
                     # Player landed on a snake or ladder, wait for animation
                     self.game_state = GAME_STATES["WAITING"]
-                    self.last_state_change = time.time()
+                    self.last_state_change = self.clock.now()
                 else:
                     # Check if player has won
-                    if player.position == 100:
+                    if player.position == self.board.last_square:
                         self.winner = player.id
                         self.game_state = GAME_STATES["GAME_OVER"]
+                        self.emit(WON, player, player.position)
                     else:
                         # Switch to next player
                         self.next_player()
@@ -150,14 +253,16 @@ class GameManager:
                 
         elif self.game_state == GAME_STATES["WAITING"]:
             # Wait for snake/ladder animation to complete
-            if time.time() - self.last_state_change > 1.0:
+            if self.clock.now() - self.last_state_change >= self.jump_delay:
                 # Update player position
                 player.update_position()
+                self.emit(JUMPED, player, player.position)
                 
                 # Check if player has won
-                if player.position == 100:
+                if player.position == self.board.last_square:
                     self.winner = player.id
                     self.game_state = GAME_STATES["GAME_OVER"]
+                    self.emit(WON, player, player.position)
                 else:
                     # Switch to next player
                     self.next_player()
@@ -0,0 +1,271 @@
+"""
+Load test for the multiplayer server: latency, rooms per core and memory per room
+
+Usage: python -m game.loadtest --rooms 2000 --players 2 --rate 1
+       python -m game.loadtest --port 8765 --rooms 500   (against a running server)
+
+Every simulated client is an asyncio task holding its own TCP connection.
+Bots join their rooms, wait until every room is full and then roll at
+--rate rolls per second per room (0 rolls as fast as the server answers)
+until all games are over. Without --port the server runs in a child
+process, so its CPU time and memory are measured apart from the clients.
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import tracemalloc
+import multiprocessing
+from game.board import DEFAULT_BOARD, load_board
+from game.server import GameServer, Room
+from game.client import GameClient
+
+def get_rss():
+    """Get the resident memory of this process in bytes, or None if unknown"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def get_server_stats(server):
+    """Get the numbers the load test samples from the server process"""
+    return {
+        "rooms": len(server.rooms),
+        "connections": server.connections,
+        "cpu": time.process_time(),
+        "rss": get_rss()
+    }
+
+async def run_server(connection, board):
+    """Serve on a free loopback port, answering stats requests over a pipe"""
+    server = GameServer(board)
+    await server.start("127.0.0.1", 0)
+    connection.send(server.port)
+    loop = asyncio.get_running_loop()
+    while await loop.run_in_executor(None, connection.recv) == "stats":
+        connection.send(get_server_stats(server))
+    await server.close()
+
+def serve_child(connection, board):
+    """Entry point of the server process"""
+    asyncio.run(run_server(connection, board))
+
+def measure_room_memory(num_players, board=DEFAULT_BOARD, count=1000):
+    """Get the Python heap bytes one idle room takes, connections aside"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    rooms = [Room(f"room-{i}", num_players, board) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del rooms
+    return (after - before) / count
+
+def percentile(values, fraction):
+    """Get a percentile of already sorted values"""
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+class LoadTest:
+    """Drives thousands of bot clients and times every state push
+
+    A roll's latency is measured from just before the roller sends it to
+    when each player in the room has read the state it produced, so one
+    roll gives a sample per seat. The state a roll produces is the next one
+    the room pushes, which the roller can name by its seq.
+    """
+    def __init__(self, rooms, players=2, rate=0.0, host="127.0.0.1", port=None):
+        self.rooms = rooms
+        self.players = players
+        self.delay = 1 / rate if rate > 0 else 0.0
+        self.host = host
+        self.port = port
+        self.sent = {}  # Room -> {seq of the expected state: time its roll was sent}
+        self.latencies = []
+        self.rolls = 0
+        self.games = 0
+        self.seated = 0
+        self.all_seated = None
+
+    async def run_bot(self, room):
+        """Play one seat of a room until the game is over"""
+        client = await GameClient.connect(self.host, self.port)
+        sent = self.sent.setdefault(room, {})
+        seat = None
+        counted = False
+        try:
+            await client.send({"type": "join", "room": room, "players": self.players})
+            while True:
+                message = await client.receive()
+                if message is None:
+                    return
+                now = time.perf_counter()
+                kind = message["type"]
+                if kind == "joined":
+                    seat = message["seat"]
+                    continue
+                if kind == "error":
+                    raise RuntimeError(message["message"])
+
+                roll_time = sent.get(message["seq"])
+                if roll_time is not None:
+                    self.latencies.append(now - roll_time)
+                if message["status"] == "over":
+                    if seat == 0:
+                        self.games += 1
+                    return
+                if message["status"] != "playing":
+                    continue
+
+                if not counted:
+                    counted = True
+                    self.seated += 1
+                    if self.seated == self.rooms * self.players:
+                        self.all_seated.set()
+                if message["turn"] == seat:
+                    await self.all_seated.wait()
+                    if self.delay:
+                        await asyncio.sleep(self.delay)
+                    sent[message["seq"] + 1] = time.perf_counter()
+                    self.rolls += 1
+                    await client.send({"type": "roll"})
+        finally:
+            await client.close()
+
+    async def run(self, server=None):
+        """Play every room to the end; server is the stats pipe, if local
+
+        Returns the wall time of the playing phase and the server stats
+        sampled before any client connected, once every room was full and
+        after the last game ended.
+        """
+        self.all_seated = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        async def sample():
+            if server is None:
+                return None
+            server.send("stats")
+            return await loop.run_in_executor(None, server.recv)
+
+        idle = await sample()
+        bots = asyncio.gather(*(
+            self.run_bot(f"load-{room}")
+            for room in range(self.rooms)
+            for _ in range(self.players)
+        ))
+        seated = asyncio.ensure_future(self.all_seated.wait())
+        await asyncio.wait([bots, seated], return_when=asyncio.FIRST_COMPLETED)
+        seated.cancel()
+        full = await sample()
+        start = time.perf_counter()
+        await bots
+        elapsed = time.perf_counter() - start
+        done = await sample()
+        return elapsed, (idle, full, done)
+
+def run_load_test(rooms, players=2, rate=0.0, host="127.0.0.1", port=None, board=DEFAULT_BOARD):
+    """Run a load test, starting a server process unless port is given"""
+    test = LoadTest(rooms, players, rate, host, port)
+    if port is not None:
+        elapsed, samples = asyncio.run(test.run())
+        return test, elapsed, samples
+
+    parent, child = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=serve_child, args=(child, board), daemon=True)
+    process.start()
+    try:
+        test.port = parent.recv()
+        elapsed, samples = asyncio.run(test.run(parent))
+    finally:
+        parent.send("stop")
+        process.join(5)
+    return test, elapsed, samples
+
+def summarize(test, elapsed, samples, room_heap=None, capacity_rate=1.0):
+    """Turn a finished load test into latency percentiles and capacity figures"""
+    latencies = sorted(test.latencies)
+    summary = {
+        "rooms": test.rooms,
+        "players": test.players,
+        "games_finished": test.games,
+        "rolls": test.rolls,
+        "seconds": elapsed,
+        "rolls_per_second": test.rolls / elapsed if elapsed else 0.0,
+        "latency_ms": {
+            name: percentile(latencies, fraction) * 1000
+            for name, fraction in [("p50", 0.50), ("p90", 0.90), ("p99", 0.99), ("p999", 0.999), ("max", 1.0)]
+        } if latencies else {},
+        "cores": os.cpu_count(),
+        "room_heap_bytes": room_heap
+    }
+
+    idle, full, done = samples
+    if idle is not None:
+        # The server runs one event loop, so a process is a core's worth
+        cpu_per_roll = (done["cpu"] - full["cpu"]) / max(test.rolls, 1)
+        summary["server_cpu_per_roll_ms"] = cpu_per_roll * 1000
+        if cpu_per_roll:
+            summary["rolls_per_core_second"] = 1 / cpu_per_roll
+            summary["rooms_per_core"] = 1 / cpu_per_roll / capacity_rate
+        if full["rss"] is not None and idle["rss"] is not None and full["rooms"]:
+            summary["rss_per_room_bytes"] = (full["rss"] - idle["rss"]) / full["rooms"]
+            summary["server_rss_bytes"] = full["rss"]
+    return summary
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Load test the multiplayer server with bot clients")
+    parser.add_argument("--rooms", type=int, default=1000, help="rooms to fill with bots at once")
+    parser.add_argument("--players", type=int, default=2, help="bots per room")
+    parser.add_argument("--rate", type=float, default=0.0, help="rolls per second per room (0: as fast as possible)")
+    parser.add_argument("--capacity-rate", type=float, default=1.0, help="rolls per second per room to size rooms per core for")
+    parser.add_argument("--host", default="127.0.0.1", help="server address")
+    parser.add_argument("--port", type=int, help="load an already running server instead of starting one")
+    parser.add_argument("--board", help="board file (.json or .toml) for the local server")
+    parser.add_argument("--output", help="also write the summary to this JSON file")
+    return parser.parse_args()
+
+def main():
+    """Run a load test and print the report"""
+    args = parse_args()
+    board = load_board(args.board) if args.board else DEFAULT_BOARD
+    room_heap = measure_room_memory(args.players, board)
+    test, elapsed, samples = run_load_test(args.rooms, args.players, args.rate, args.host, args.port, board)
+    summary = summarize(test, elapsed, samples, room_heap, args.capacity_rate)
+
+    print(
+        f"Rooms: {args.rooms} x {args.players} clients, {summary['games_finished']} games finished, "
+        f"{summary['rolls']} rolls in {elapsed:.2f}s ({summary['rolls_per_second']:.0f} rolls/s)"
+    )
+    latency = summary["latency_ms"]
+    if latency:
+        print(
+            f"Roll to state latency (ms): p50 {latency['p50']:.2f}, p90 {latency['p90']:.2f}, "
+            f"p99 {latency['p99']:.2f}, p99.9 {latency['p999']:.2f}, max {latency['max']:.2f}"
+        )
+    if "rolls_per_core_second" in summary:
+        print(
+            f"Server CPU: {summary['server_cpu_per_roll_ms']:.3f} ms per roll, "
+            f"{summary['rolls_per_core_second']:.0f} rolls per core-second, "
+            f"~{summary['rooms_per_core']:.0f} rooms per core at {args.capacity_rate:g} rolls/s per room "
+            f"({summary['cores']} cores here)"
+        )
+    if "rss_per_room_bytes" in summary:
+        print(
+            f"Memory: {summary['rss_per_room_bytes'] / 1024:.1f} KiB RSS per live room "
+            f"(server {summary['server_rss_bytes'] / 2 ** 20:.1f} MiB at {args.rooms} rooms), "
+            f"{room_heap / 1024:.1f} KiB Python heap per idle room"
+        )
+    else:
+        print(f"Memory: {room_heap / 1024:.1f} KiB Python heap per idle room")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(summary, f, indent=2)
+        print(f"Summary written to {args.output}")
+    return 0 if summary["games_finished"] == args.rooms else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""
+Exact Markov-chain solver for game length and win probabilities
+
+The board is an absorbing Markov chain over squares 1-100 (or 1 to the last
+square of another layout). Each roll moves a player min(position + roll,
+last square) and then follows any snake or ladder on the
+landing square, so one player's progress only depends on their own rolls.
+"""
+import sys
+import numpy as np
+from game.board import DEFAULT_BOARD, load_board
+
+# Largest board the dense solver handles: the matrix takes (squares + 1)^2
+# floats, about 50 MB at 2500 squares (50x50)
+MAX_MARKOV_SQUARES = 2500
+
+def transition_matrix(board=DEFAULT_BOARD):
+    """Build the single-roll transition matrix indexed by square (101x101 by default)
+
+    Square 0 is never occupied and is kept as an absorbing placeholder so the
+    matrix stays row-stochastic. The last square is the absorbing finish.
+    """
+    last_square = board.last_square
+    if last_square > MAX_MARKOV_SQUARES:
+        raise ValueError(
+            f"{board.name} has {last_square} squares; the Markov solver handles up to "
+            f"{MAX_MARKOV_SQUARES}, use game.simulator for larger boards"
+        )
+    matrix = np.zeros((last_square + 1, last_square + 1))
+    matrix[0, 0] = 1.0
+    matrix[last_square, last_square] = 1.0
+    for square in range(1, last_square):
+        for roll in range(1, 7):
+            matrix[square, board.final[min(square + roll, last_square)]] += 1 / 6
+    return matrix
+
+def expected_turns(matrix=None, start=1):
+    """Expected number of rolls for one player to reach the last square"""
+    if matrix is None:
+        matrix = transition_matrix()
+
+    # Solve (I - Q) t = 1 over the transient squares (1-99 on a 10x10 board)
+    last_square = matrix.shape[0] - 1
+    q = matrix[1:last_square, 1:last_square]
+    steps = np.linalg.solve(np.eye(last_square - 1) - q, np.ones(last_square - 1))
+    return float(steps[start - 1])
+
+def finish_distribution(matrix=None, start=1, tolerance=1e-12, max_turns=10000):
+    """Probability of reaching the last square on exactly roll n, for n = 0, 1, 2, ..."""
+    if matrix is None:
+        matrix = transition_matrix()
+
+    state = np.zeros(matrix.shape[0])
+    state[start] = 1.0
+    finished = [state[-1]]
+    while 1.0 - state[-1] > tolerance and len(finished) <= max_turns:
+        state = state @ matrix
+        finished.append(state[-1])
+
+    # Convert the cumulative finish probability into a per-roll distribution
+    cumulative = np.array(finished)
+    return np.diff(cumulative, prepend=0.0)
+
+def win_probabilities(num_players=2, matrix=None):
+    """Probability that each seat wins when players take turns in order
+
+    Players move independently, so seat k wins on its n-th roll when it
+    finishes on roll n, every earlier seat has not finished within n rolls
+    and every later seat has not finished within n - 1 rolls.
+    """
+    pmf = finish_distribution(matrix)
+    cdf = np.cumsum(pmf)
+    survive = 1.0 - cdf
+    survive_before = np.concatenate(([1.0], survive[:-1]))
+
+    return [
+        float(np.sum(pmf * survive ** seat * survive_before ** (num_players - 1 - seat)))
+        for seat in range(num_players)
+    ]
+
+def expected_game_turns(num_players=2, matrix=None):
+    """Expected total number of rolls in a game, counting every player's turns"""
+    pmf = finish_distribution(matrix)
+    cdf = np.cumsum(pmf)
+    survive = 1.0 - cdf
+    survive_before = np.concatenate(([1.0], survive[:-1]))
+    rolls = np.arange(pmf.size)
+
+    expected = 0.0
+    for seat in range(num_players):
+        win_at = pmf * survive ** seat * survive_before ** (num_players - 1 - seat)
+        expected += float(np.sum(win_at * ((rolls - 1) * num_players + seat + 1)))
+    return expected
+
+def first_player_advantage(num_players=2, matrix=None):
+    """How much more often the first seat wins than a fair 1 / num_players share"""
+    return win_probabilities(num_players, matrix)[0] - 1 / num_players
+
+def main():
+    """Print exact statistics for the default board or a board file"""
+    num_players = int(sys.argv[1]) if len(sys.argv) > 1 else 2
+    board = load_board(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_BOARD
+    matrix = transition_matrix(board)
+
+    print(f"Expected rolls for one player: {expected_turns(matrix):.4f}")
+    print(f"Expected turns per game: {expected_game_turns(num_players, matrix):.4f}")
+    for seat, rate in enumerate(win_probabilities(num_players, matrix)):
+        print(f"Player {seat + 1} win probability: {rate:.6f}")
+    print(f"First player advantage: {first_player_advantage(num_players, matrix):+.6f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
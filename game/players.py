@@ -0,0 +1,36 @@
+"""
+Compact struct-of-arrays player state for large headless games
+"""
+from array import array
+from ui.constants import PLAYER_TYPES
+
+# Per-player counters kept by the store (same keys as the scoreboard)
+STAT_KEYS = ("moves", "ladders", "snakes", "sixes")
+
+class PlayerStore:
+    """State for any number of players held in flat arrays
+
+    Seat i's state lives at index i of each array, so a game with thousands
+    of players allocates a handful of arrays instead of one object per
+    player, and reset() reuses them between games.
+    """
+    __slots__ = ("count", "positions", "types", "last_rolls", "stats")
+
+    def __init__(self, count, player_type=PLAYER_TYPES["AI"]):
+        self.count = count
+        self.positions = array("H", [1]) * count
+        self.types = array("B", [player_type]) * count
+        self.last_rolls = array("B", bytes(count))
+        self.stats = {key: array("I", [0]) * count for key in STAT_KEYS}
+
+    def __len__(self):
+        return self.count
+
+    def reset(self):
+        """Move every player back to square 1 and clear their stats"""
+        for i in range(self.count):
+            self.positions[i] = 1
+            self.last_rolls[i] = 0
+        for counts in self.stats.values():
+            for i in range(self.count):
+                counts[i] = 0
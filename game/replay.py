@@ -0,0 +1,120 @@
+"""
+Compact binary replay log: the game seed plus one byte per dice roll
+
+Usage: python -m game.replay game.replay [board file]
+
+Layout (little endian):
+    header  4-byte magic, uint8 version, uint16 player count, uint64 seed,
+            uint32 CRC of the board's jump table
+    rolls   one byte per roll, in the order they were made
+"""
+import sys
+import zlib
+import random
+import struct
+from game.board import DEFAULT_BOARD, load_board
+
+REPLAY_MAGIC = b"SLRP"
+REPLAY_VERSION = 1
+HEADER = struct.Struct("<4sBHQI")
+
+def board_checksum(board):
+    """Get a checksum identifying the snakes and ladders of a board"""
+    return zlib.crc32(board.final.tobytes())
+
+def roll_sequence(seed):
+    """Get the dice rolls a game RNG seeded with seed produces, one at a time"""
+    rng = random.Random(seed)
+    while True:
+        yield rng.randint(1, 6)
+
+class ReplayLog:
+    """Seed and dice rolls of one game, enough to replay it exactly
+
+    The rolls alone decide the whole game, so a log can be re-simulated
+    headless in microseconds or fed back into a GameManager to watch it.
+    """
+    def __init__(self, seed, num_players=2, board=DEFAULT_BOARD, rolls=b""):
+        self.seed = seed
+        self.num_players = num_players
+        self.board = board
+        self.rolls = bytearray(rolls)
+
+    def __len__(self):
+        return len(self.rolls)
+
+    def record(self, roll):
+        """Append a dice roll"""
+        self.rolls.append(roll)
+
+    def to_bytes(self):
+        """Encode the log"""
+        header = HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.num_players, self.seed, board_checksum(self.board))
+        return header + bytes(self.rolls)
+
+    @classmethod
+    def from_bytes(cls, data, board=DEFAULT_BOARD):
+        """Decode a log; raises ValueError if it is not a replay for this board"""
+        if len(data) < HEADER.size:
+            raise ValueError("Replay is too short")
+        magic, version, num_players, seed, checksum = HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError("Not a replay file (or an unsupported version)")
+        if checksum != board_checksum(board):
+            raise ValueError(f"Replay was recorded on a different board than {board.name}")
+        rolls = data[HEADER.size:]
+        if any(not 1 <= roll <= 6 for roll in rolls):
+            raise ValueError("Replay contains rolls outside 1-6")
+        return cls(seed, num_players, board, rolls)
+
+    def save(self, path):
+        """Write the log to a file"""
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path, board=DEFAULT_BOARD):
+        """Read a log from a file"""
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read(), board)
+
+    def verify(self):
+        """Check that the rolls are the ones the seed produces"""
+        return all(roll == expected for roll, expected in zip(self.rolls, roll_sequence(self.seed)))
+
+    def simulate(self):
+        """Replay the rolls headless and return the outcome
+
+        Players take turns in seat order, exactly as GameManager plays them.
+        winner is None if the log stops before anyone finishes.
+        """
+        final = self.board.final
+        last_square = self.board.last_square
+        positions = [1] * self.num_players
+        seat = 0
+        for turn, roll in enumerate(self.rolls):
+            positions[seat] = final[min(positions[seat] + roll, last_square)]
+            if positions[seat] == last_square:
+                return {"winner": seat, "turns": turn + 1, "positions": positions}
+            seat = (seat + 1) % self.num_players
+        return {"winner": None, "turns": len(self.rolls), "positions": positions}
+
+def main():
+    """Re-simulate a replay file and print the outcome"""
+    if len(sys.argv) < 2:
+        print("Usage: python -m game.replay <replay file> [board file]")
+        return 2
+    board = load_board(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_BOARD
+    log = ReplayLog.load(sys.argv[1], board)
+    result = log.simulate()
+
+    print(f"Seed: {log.seed}, players: {log.num_players}, rolls: {len(log)}")
+    print(f"Rolls match seed: {'yes' if log.verify() else 'NO'}")
+    if result["winner"] is None:
+        print(f"Unfinished after {result['turns']} turns, positions {result['positions']}")
+    else:
+        print(f"Player {result['winner'] + 1} won after {result['turns']} turns, positions {result['positions']}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,310 @@
+"""
+Asyncio multiplayer server hosting many GameManager rooms over JSON lines
+
+Usage: python -m game.server --host 0.0.0.0 --port 8765
+
+Every message is one JSON object per line.
+
+Client to server:
+    {"type": "join", "room": "abc", "players": 2, "name": "Ann"}
+        Take a seat in a room, creating it for "players" seats if needed.
+        Without "room" the player is matched into any open room of that size.
+    {"type": "roll"}    Roll the dice (only on your turn)
+    {"type": "state"}   Ask for the current state again
+    {"type": "leave"}   Give up the seat; an AI plays it from then on
+
+Server to client:
+    {"type": "joined", "room": ..., "seat": 0, "players": 2}
+    {"type": "state", "room": ..., "seq": 3, "status": "waiting|playing|over",
+     "seats": [...], "turn": 0, "positions": [...], "winner": null,
+     "events": [["rolled", 0, 4], ["moved", 0, 5], ...]}
+        Pushed to everyone in the room after every change, with the
+        events since the previous push
+    {"type": "error", "message": ...}
+
+Rooms play in turbo mode: moves resolve immediately on the server and
+clients animate them from the pushed events.
+"""
+import sys
+import json
+import asyncio
+import argparse
+import itertools
+from game.game_manager import GameManager
+from game.board import DEFAULT_BOARD, load_board
+from ui.constants import PLAYER_TYPES, GAME_STATES
+
+DEFAULT_PORT = 8765
+MAX_ROOM_PLAYERS = 8
+MAX_LINE = 4096  # Longest message accepted from a client
+MAX_BUFFERED = 256 * 1024  # Clients this far behind on reading are dropped
+BACKLOG = 1024  # Pending connections queued while thousands of clients connect at once
+
+def encode(message):
+    """Encode a message as one JSON line"""
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode()
+
+class Room:
+    """One game and the connections seated at it"""
+    __slots__ = ("name", "game", "seats", "pending", "seq", "started")
+
+    def __init__(self, name, num_players, board=DEFAULT_BOARD, seed=None):
+        self.name = name
+        self.game = GameManager(num_players, board, turbo=True)
+        self.game.reset_game(seed=seed)
+        for player in self.game.players:
+            player.type = PLAYER_TYPES["HUMAN"]
+        self.seats = [None] * num_players  # Connection per seat
+        self.pending = []  # Events not yet pushed to the clients
+        self.seq = 0
+        self.started = False
+        self.game.events.listeners.append(self.pending.append)
+
+    @property
+    def is_full(self):
+        return None not in self.seats
+
+    @property
+    def is_over(self):
+        return self.game.game_state == GAME_STATES["GAME_OVER"]
+
+    def get_status(self):
+        """Get whether the room is waiting for players, playing or finished"""
+        if self.is_over:
+            return "over"
+        return "playing" if self.started else "waiting"
+
+    def advance(self):
+        """Play the game forward until a connected human has to roll
+
+        Moves resolve at once in turbo mode, and seats left by their player
+        are AI, so this only stops on a human's turn or at the end.
+        """
+        game = self.game
+        while not self.is_over:
+            if game.game_state == GAME_STATES["IDLE"] and game.get_current_player().type == PLAYER_TYPES["HUMAN"]:
+                return
+            game.update(0)
+
+    def get_state(self):
+        """Get the state message for the room, taking the pending events"""
+        self.seq += 1
+        game = self.game
+        events = [list(event) for event in self.pending]
+        self.pending.clear()
+        return {
+            "type": "state",
+            "room": self.name,
+            "seq": self.seq,
+            "status": self.get_status(),
+            "seats": [connection.name if connection else None for connection in self.seats],
+            "turn": game.current_player_idx,
+            "positions": [player.position for player in game.players],
+            "winner": game.winner,
+            "events": events
+        }
+
+class Connection:
+    """A connected client and where it is seated"""
+    __slots__ = ("writer", "name", "room", "seat")
+
+    def __init__(self, writer, name):
+        self.writer = writer
+        self.name = name
+        self.room = None
+        self.seat = None
+
+    def send(self, data):
+        """Queue encoded data, dropping the client if it has stopped reading"""
+        transport = self.writer.transport
+        if transport.is_closing():
+            return
+        if transport.get_write_buffer_size() > MAX_BUFFERED:
+            transport.abort()
+            return
+        self.writer.write(data)
+
+class GameServer:
+    """Hosts rooms and routes client messages to them
+
+    Everything runs on one event loop, so rooms need no locking: a message
+    is handled, the room is advanced and the new state is pushed to every
+    client in it before the next message is read.
+    """
+    def __init__(self, board=DEFAULT_BOARD, max_rooms=None):
+        self.board = board
+        self.max_rooms = max_rooms
+        self.rooms = {}
+        self.open_rooms = {}  # Player count -> name of a room still filling up
+        self.room_ids = itertools.count(1)
+        self.client_ids = itertools.count(1)
+        self.connections = 0
+        self.server = None
+
+    async def start(self, host="127.0.0.1", port=DEFAULT_PORT):
+        """Start listening; port 0 picks a free port (see self.port)"""
+        self.server = await asyncio.start_server(self.handle_client, host, port, limit=MAX_LINE, backlog=BACKLOG)
+        return self.server
+
+    @property
+    def port(self):
+        return self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        """Stop accepting clients and wait for the listener to close"""
+        self.server.close()
+        await self.server.wait_closed()
+
+    def broadcast(self, room):
+        """Push the room state to everyone seated in it (encoded once)"""
+        data = encode(room.get_state())
+        for connection in room.seats:
+            if connection is not None:
+                connection.send(data)
+
+    def find_room(self, name, num_players):
+        """Get the room to join, creating it if needed"""
+        if name is None:
+            name = self.open_rooms.get(num_players)
+            if name is None or name not in self.rooms or self.rooms[name].started:
+                name = f"room-{next(self.room_ids)}"
+                self.open_rooms[num_players] = name
+
+        room = self.rooms.get(name)
+        if room is None:
+            if self.max_rooms is not None and len(self.rooms) >= self.max_rooms:
+                raise ValueError("Server is full")
+            room = self.rooms[name] = Room(name, num_players, self.board)
+        return room
+
+    def join(self, connection, message):
+        """Seat a connection in a room and start the game once it is full"""
+        if connection.room is not None:
+            raise ValueError("Already in a room")
+        num_players = message.get("players", 2)
+        if not isinstance(num_players, int) or not 2 <= num_players <= MAX_ROOM_PLAYERS:
+            raise ValueError(f"players must be 2-{MAX_ROOM_PLAYERS}")
+        name = message.get("room")
+        if name is not None and not isinstance(name, str):
+            raise ValueError("room must be a string")
+        if isinstance(message.get("name"), str):
+            connection.name = message["name"][:32]
+
+        room = self.find_room(name, num_players)
+        if room.started or room.is_full:
+            raise ValueError(f"Room {room.name} is already playing")
+
+        seat = room.seats.index(None)
+        room.seats[seat] = connection
+        connection.room = room
+        connection.seat = seat
+        connection.send(encode({"type": "joined", "room": room.name, "seat": seat, "players": len(room.seats)}))
+
+        if room.is_full:
+            room.started = True
+            room.advance()
+        self.broadcast(room)
+
+    def roll(self, connection):
+        """Roll for the connection if it is their turn"""
+        room = connection.room
+        if room is None or not room.started:
+            raise ValueError("The game has not started")
+        game = room.game
+        if room.is_over:
+            raise ValueError("The game is over")
+        if game.current_player_idx != connection.seat or game.game_state != GAME_STATES["IDLE"]:
+            raise ValueError("Not your turn")
+        game.roll_dice()
+        room.advance()
+        self.broadcast(room)
+
+    def leave(self, connection):
+        """Free the connection's seat, handing it to an AI mid-game"""
+        room = connection.room
+        if room is None:
+            return
+        room.seats[connection.seat] = None
+        connection.room = None
+
+        if all(seat is None for seat in room.seats):
+            del self.rooms[room.name]
+            return
+        if room.started:
+            room.game.players[connection.seat].type = PLAYER_TYPES["AI"]
+            room.advance()
+        self.broadcast(room)
+
+    def handle_message(self, connection, message):
+        """Handle one decoded client message"""
+        kind = message.get("type")
+        if kind == "join":
+            self.join(connection, message)
+        elif kind == "roll":
+            self.roll(connection)
+        elif kind == "state":
+            if connection.room is None:
+                raise ValueError("Not in a room")
+            connection.send(encode(connection.room.get_state()))
+        elif kind == "leave":
+            self.leave(connection)
+        else:
+            raise ValueError(f"Unknown message type {kind!r}")
+
+    async def handle_client(self, reader, writer):
+        """Read and handle one client's messages until it disconnects"""
+        connection = Connection(writer, f"player-{next(self.client_ids)}")
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    connection.send(encode({"type": "error", "message": "Message too long"}))
+                    break
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                    if not isinstance(message, dict):
+                        raise ValueError("Messages must be JSON objects")
+                    self.handle_message(connection, message)
+                except ValueError as e:  # Includes JSONDecodeError
+                    connection.send(encode({"type": "error", "message": str(e)}))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.connections -= 1
+            self.leave(connection)
+            writer.close()
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Host multiplayer Snakes and Ladders rooms")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="port to listen on")
+    parser.add_argument("--board", help="board file (.json or .toml) every room plays on")
+    parser.add_argument("--max-rooms", type=int, help="refuse new rooms beyond this many")
+    return parser.parse_args()
+
+async def serve(args):
+    """Run the server until cancelled"""
+    board = load_board(args.board) if args.board else DEFAULT_BOARD
+    server = GameServer(board, args.max_rooms)
+    await server.start(args.host, args.port)
+    print(f"Serving {board.name} rooms on {args.host}:{server.port}")
+    async with server.server:
+        await server.server.serve_forever()
+
+def main():
+    """Run the game server"""
+    args = parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
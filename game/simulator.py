@@ -0,0 +1,91 @@
+"""
+Vectorized batch simulator for playing many games at once with NumPy
+"""
+import sys
+import numpy as np
+from game.board import DEFAULT_BOARD, load_board
+
+def simulate_games(num_games, num_players=2, seed=None, board=DEFAULT_BOARD, max_turns=None):
+    """Play num_games games in lockstep and return per-game results
+
+    Every game keeps a row of player positions. Each step rolls one die per
+    unfinished game for the seat whose turn it is and resolves snakes and
+    ladders with a single lookup into the jump table. Finished games are
+    dropped from the active set so later steps only touch games still in play.
+    """
+    rng = np.random.default_rng(seed)
+    last_square = board.last_square
+    # int16 holds every square up to 181x181 boards, even after adding a roll
+    square_type = np.int16 if last_square + 6 <= np.iinfo(np.int16).max else np.int32
+    jump_table = np.array(board.final, dtype=square_type)
+
+    # Positions are stored seat-major so each step reads one contiguous row
+    positions = np.ones((num_players, num_games), dtype=square_type)
+    snake_hits = np.zeros((num_players, num_games), dtype=np.int32)
+    ladder_hits = np.zeros((num_players, num_games), dtype=np.int32)
+    turns = np.zeros(num_games, dtype=np.int32)
+    winners = np.full(num_games, -1, dtype=np.int16)
+
+    active = np.arange(num_games)
+    turn = 0
+    while active.size and (max_turns is None or turn < max_turns):
+        seat = turn % num_players
+        turn += 1
+
+        # Roll for every active game and resolve snakes and ladders
+        rolls = rng.integers(1, 7, size=active.size, dtype=square_type)
+        landed = np.minimum(positions[seat, active] + rolls, last_square)
+        final = jump_table[landed]
+        positions[seat, active] = final
+        snake_hits[seat, active] += final < landed
+        ladder_hits[seat, active] += final > landed
+
+        # Record winners and drop finished games
+        won = final == last_square
+        if won.any():
+            finished = active[won]
+            winners[finished] = seat
+            turns[finished] = turn
+            active = active[~won]
+
+    # Games cut off by max_turns keep winner -1
+    turns[active] = turn
+
+    return {
+        "turns": turns,
+        "winners": winners,
+        "snake_hits": snake_hits.T,
+        "ladder_hits": ladder_hits.T
+    }
+
+def summarize(results, num_players=2):
+    """Summarize simulation results into win rates and averages"""
+    winners = results["winners"]
+    finished = winners >= 0
+    return {
+        "games": int(winners.size),
+        "win_rate": (np.bincount(winners[finished], minlength=num_players) / max(int(finished.sum()), 1)).tolist(),
+        "mean_turns": float(results["turns"][finished].mean()) if finished.any() else 0.0,
+        "snakes_per_game": float(results["snake_hits"].sum(axis=1).mean()),
+        "ladders_per_game": float(results["ladder_hits"].sum(axis=1).mean())
+    }
+
+def main():
+    """Run a batch simulation and print a summary"""
+    num_games = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    num_players = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    board = load_board(sys.argv[3]) if len(sys.argv) > 3 else DEFAULT_BOARD
+
+    results = simulate_games(num_games, num_players, board=board)
+    summary = summarize(results, num_players)
+
+    print(f"Games played: {summary['games']}")
+    for seat, rate in enumerate(summary["win_rate"]):
+        print(f"Player {seat + 1} win rate: {rate:.4f}")
+    print(f"Mean turns per game: {summary['mean_turns']:.2f}")
+    print(f"Snakes per game: {summary['snakes_per_game']:.2f}")
+    print(f"Ladders per game: {summary['ladders_per_game']:.2f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
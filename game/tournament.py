@@ -0,0 +1,144 @@
+"""
+Batch tournament runner that plays complete games across a process pool
+
+Usage: python -m game.tournament --games 1000000 --players 2 --workers 32
+"""
+import os
+import sys
+import json
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from game.engine import GameEngine
+from game.board import DEFAULT_BOARD, load_board
+
+def play_chunk(chunk_index, num_games, num_players, seed, board=DEFAULT_BOARD):
+    """Play one work unit of games and return its aggregated stats
+
+    Each chunk seeds its own RNG from (seed, chunk_index), so results do not
+    depend on which worker ran it or how many workers there are.
+    """
+    engine = GameEngine(num_players, board, seed=f"{seed}-{chunk_index}")
+
+    wins = [0] * num_players
+    turns = Counter()
+    stats = {key: [0] * num_players for key in engine.stats}
+    for _ in range(num_games):
+        engine.reset()
+        wins[engine.play_game()] += 1
+        turns[engine.turns] += 1
+        for key, counts in engine.stats.items():
+            for seat, count in enumerate(counts):
+                stats[key][seat] += count
+
+    return {"games": num_games, "wins": wins, "turns": turns, "stats": stats}
+
+def merge_results(results, num_players):
+    """Combine the stats returned by several chunks"""
+    merged = {
+        "games": 0,
+        "wins": [0] * num_players,
+        "turns": Counter(),
+        "stats": {}
+    }
+    for result in results:
+        merged["games"] += result["games"]
+        merged["turns"].update(result["turns"])
+        for seat in range(num_players):
+            merged["wins"][seat] += result["wins"][seat]
+        for key, counts in result["stats"].items():
+            totals = merged["stats"].setdefault(key, [0] * num_players)
+            for seat in range(num_players):
+                totals[seat] += counts[seat]
+    return merged
+
+def run_tournament(num_games, num_players=2, workers=None, chunk_size=1000, seed=0, board=DEFAULT_BOARD):
+    """Play num_games games split into chunks across a process pool"""
+    chunks = []
+    for chunk_index, start in enumerate(range(0, num_games, chunk_size)):
+        chunks.append((chunk_index, min(chunk_size, num_games - start)))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(play_chunk, chunk_index, games, num_players, seed, board)
+            for chunk_index, games in chunks
+        ]
+        return merge_results((future.result() for future in futures), num_players)
+
+def summarize(results):
+    """Turn merged results into win rates, turn percentiles and hit rates"""
+    games = results["games"]
+    turns = results["turns"]
+    stats = results["stats"]
+
+    # Percentiles from the turns-to-finish histogram
+    percentiles = {}
+    targets = [("p50", 0.50), ("p90", 0.90), ("p99", 0.99)]
+    seen = 0
+    for length in sorted(turns):
+        seen += turns[length]
+        while targets and seen >= targets[0][1] * games:
+            percentiles[targets.pop(0)[0]] = length
+
+    moves = stats["moves"]
+    return {
+        "games": games,
+        "win_rate": [wins / games for wins in results["wins"]],
+        "mean_turns": sum(length * count for length, count in turns.items()) / games,
+        "turn_percentiles": percentiles,
+        "snakes_per_game": [count / games for count in stats["snakes"]],
+        "ladders_per_game": [count / games for count in stats["ladders"]],
+        "snake_hit_rate": [snakes / max(move, 1) for snakes, move in zip(stats["snakes"], moves)],
+        "ladder_hit_rate": [ladders / max(move, 1) for ladders, move in zip(stats["ladders"], moves)],
+        "turns_histogram": {str(length): turns[length] for length in sorted(turns)}
+    }
+
+def positive_int(value):
+    """Parse a count that must be at least 1"""
+    count = int(value)
+    if count < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return count
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Play many headless games across all cores")
+    parser.add_argument("--games", type=positive_int, default=100000, help="number of games to play")
+    parser.add_argument("--players", type=positive_int, default=2, help="players per game")
+    parser.add_argument("--workers", type=positive_int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--chunk-size", type=positive_int, default=1000, help="games per work unit")
+    parser.add_argument("--seed", default="0", help="base seed for the per-chunk RNGs")
+    parser.add_argument("--board", help="board file (.json or .toml) to play on instead of the default")
+    parser.add_argument("--output", help="also write the full summary to this JSON file")
+    return parser.parse_args()
+
+def main():
+    """Run a tournament and print the aggregated stats"""
+    args = parse_args()
+    board = load_board(args.board) if args.board else DEFAULT_BOARD
+    results = run_tournament(args.games, args.players, args.workers, args.chunk_size, args.seed, board)
+    summary = summarize(results)
+
+    print(f"Games played: {summary['games']}")
+    for seat in range(args.players):
+        print(
+            f"Player {seat + 1}: win rate {summary['win_rate'][seat]:.4f}, "
+            f"snakes/game {summary['snakes_per_game'][seat]:.2f}, "
+            f"ladders/game {summary['ladders_per_game'][seat]:.2f}, "
+            f"snake hit rate {summary['snake_hit_rate'][seat]:.4f}, "
+            f"ladder hit rate {summary['ladder_hit_rate'][seat]:.4f}"
+        )
+    percentiles = summary["turn_percentiles"]
+    print(
+        f"Turns per game: mean {summary['mean_turns']:.2f}, "
+        f"p50 {percentiles['p50']}, p90 {percentiles['p90']}, p99 {percentiles['p99']}"
+    )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(summary, f, indent=2)
+        print(f"Summary written to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
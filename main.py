@@ -3,14 +3,128 @@
 Modern Snakes and Ladders Game
 Main entry point for the game
 """
+import os
 import sys
+import argparse
 import pygame
 from game.game_manager import GameManager
+from game.clock import SystemClock, FixedTimestep
+from game.board import DEFAULT_BOARD, BOARDS_DIR, load_board
+from game.replay import ReplayLog
 from ui.screens import WelcomeScreen, GameScreen, GameOverScreen
-from ui.constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, COLORS
+from ui.constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, COLORS, LOGIC_TICK, MAX_SCREEN_PLAYERS, ASSET_BUNDLE
+from ui.profiler import FrameProfiler
+from ui.assets import ASSETS
+
+def env_flag(name):
+    """Check whether an on/off environment variable is set to on"""
+    return os.environ.get(name, "").strip().lower() not in ("", "0", "false", "no", "off")
+
+def players_count(value):
+    """Parse a player count that fits on screen"""
+    count = int(value)
+    if not 2 <= count <= MAX_SCREEN_PLAYERS:
+        raise argparse.ArgumentTypeError(f"must be between 2 and {MAX_SCREEN_PLAYERS}")
+    return count
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Modern Snakes and Ladders")
+    parser.add_argument(
+        "--dirty-rects",
+        action="store_true",
+        default=env_flag("SNAKES_DIRTY_RECTS"),
+        help="only redraw and update the parts of the screen that changed "
+             "(also enabled by setting SNAKES_DIRTY_RECTS)"
+    )
+    parser.add_argument(
+        "--players",
+        type=players_count,
+        default=os.environ.get("SNAKES_PLAYERS", "2"),
+        help=f"number of players, 2 to {MAX_SCREEN_PLAYERS} (also set by SNAKES_PLAYERS); "
+             "everyone after player 1 is AI"
+    )
+    parser.add_argument(
+        "--board",
+        default=os.environ.get("SNAKES_BOARD"),
+        help="board file (.json or .toml) to start on (also set by SNAKES_BOARD); "
+             f"press B in game to cycle through the boards in {BOARDS_DIR}/"
+    )
+    parser.add_argument(
+        "--replay-dir",
+        default=os.environ.get("SNAKES_REPLAY_DIR"),
+        help="save a replay log of every finished game in this directory "
+             "(also set by SNAKES_REPLAY_DIR)"
+    )
+    parser.add_argument(
+        "--replay",
+        help="watch a saved replay log instead of playing (use --board if it "
+             "was recorded on a board file)"
+    )
+    parser.add_argument(
+        "--turbo",
+        action="store_true",
+        default=env_flag("SNAKES_TURBO"),
+        help="skip all game delays and run one logic tick per frame without "
+             "a frame rate cap (also enabled by setting SNAKES_TURBO)"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=env_flag("SNAKES_PROFILE"),
+        help="time each stage of the main loop and show an overlay "
+             "(also enabled by setting SNAKES_PROFILE)"
+    )
+    parser.add_argument(
+        "--profile-output",
+        default=os.environ.get("SNAKES_PROFILE_OUTPUT", "profile.json"),
+        help="file the profile is written to on exit (.json or .csv)"
+    )
+    return parser.parse_args()
+
+def instrument_components(profiler, game_screen):
+    """Time the draw call of each game screen component separately"""
+    profiler.instrument(game_screen.board, "draw", "Board.draw")
+    profiler.instrument(game_screen.dice, "draw", "Dice.draw")
+    profiler.instrument(game_screen.scoreboard, "draw", "Scoreboard.draw")
+    for token in game_screen.player_tokens:
+        profiler.instrument(token, "draw", f"PlayerToken[{token.player_id}].draw")
+
+def save_replay(replay, directory):
+    """Save a finished game's replay log, named after its seed"""
+    path = os.path.join(directory, f"{replay.seed:016x}.replay")
+    try:
+        os.makedirs(directory, exist_ok=True)
+        replay.save(path)
+    except OSError as e:
+        print(f"Warning: Could not save replay {path} ({e})")
+
+def draw_dirty(screen, current_screen, profiler):
+    """Redraw only the changed areas of the screen and push them to the display"""
+    rects = current_screen.get_dirty_rects() + profiler.get_dirty_rects()
+    if not rects:
+        return
+    
+    # Redraw each rect on its own, clipped so only what lies inside it is
+    # touched; each stage is still timed once per frame
+    with profiler.stage("draw"):
+        for rect in rects:
+            screen.set_clip(rect)
+            screen.fill(COLORS["background"])
+            current_screen.draw_region(rect)
+    with profiler.stage("overlay"):
+        for rect in rects:
+            screen.set_clip(rect)
+            profiler.draw_overlay(screen)
+    screen.set_clip(None)
+    
+    with profiler.stage("display.update"):
+        pygame.display.update(rects)
 
 def main():
     """Main function to initialize and run the game"""
+    args = parse_args()
+    
     # Initialize pygame
     pygame.init()
     pygame.mixer.init()  # For sound effects
@@ -19,16 +133,43 @@ def main():
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Modern Snakes and Ladders")
     
+    # Read assets from the packed bundle when one has been built
+    if os.path.exists(ASSET_BUNDLE):
+        try:
+            ASSETS.open_bundle(ASSET_BUNDLE)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not open {ASSET_BUNDLE} ({e}). Loading asset files instead.")
+    
     # Create a clock for controlling the frame rate
     clock = pygame.time.Clock()
+    profiler = FrameProfiler(enabled=args.profile)
     
     # Initialize game manager
-    game_manager = GameManager()
+    board = DEFAULT_BOARD
+    if args.board:
+        try:
+            board = load_board(args.board)
+        except ValueError as e:
+            print(f"Warning: {e}. Using the default board.")
+    playback = None
+    if args.replay:
+        try:
+            playback = ReplayLog.load(args.replay, board)
+        except (OSError, ValueError) as e:
+            print(f"Error: Could not load replay {args.replay} ({e})")
+            pygame.quit()
+            sys.exit(1)
+    num_players = playback.num_players if playback is not None else args.players
+    game_manager = GameManager(num_players, board, turbo=args.turbo, playback=playback)
+    
+    # Game logic runs on fixed ticks, decoupled from the frame rate
+    timestep = FixedTimestep(SystemClock())
     
     # Initialize screens
     welcome_screen = WelcomeScreen(screen)
     game_screen = GameScreen(screen, game_manager)
     game_over_screen = GameOverScreen(screen)
+    instrument_components(profiler, game_screen)
     
     # Set initial screen
     current_screen = welcome_screen
@@ -37,37 +178,62 @@ def main():
     running = True
     while running:
         # Handle events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            
-            # Pass events to current screen
-            result = current_screen.handle_event(event)
-            
-            # Handle screen transitions
-            if result == "start_game":
-                game_manager.reset_game(welcome_screen.get_game_mode())
-                current_screen = game_screen
-            elif result == "game_over":
-                game_over_screen.set_winner(game_manager.get_winner())
-                current_screen = game_over_screen
-            elif result == "main_menu":
-                current_screen = welcome_screen
-            elif result == "quit":
-                running = False
+        with profiler.stage("events"):
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                
+                # Pass events to current screen
+                result = current_screen.handle_event(event)
+                
+                # Handle screen transitions
+                previous_screen = current_screen
+                if result == "start_game":
+                    game_manager.reset_game(welcome_screen.get_game_mode())
+                    current_screen = game_screen
+                elif result == "game_over":
+                    game_over_screen.set_winner(game_manager.get_winner())
+                    if args.replay_dir and playback is None:
+                        save_replay(game_manager.replay, args.replay_dir)
+                    current_screen = game_over_screen
+                elif result == "main_menu":
+                    current_screen = welcome_screen
+                elif result == "quit":
+                    running = False
+                    
+                if current_screen is not previous_screen:
+                    current_screen.invalidate()
         
-        # Update current screen
-        current_screen.update()
+        # Update current screen once per logic tick
+        with profiler.stage("update"):
+            ASSETS.poll()
+            steps = 1 if args.turbo else timestep.advance()
+            for _ in range(steps):
+                current_screen.update(LOGIC_TICK)
+            current_screen.set_render_alpha(1.0 if args.turbo else timestep.alpha)
         
         # Draw current screen
-        screen.fill(COLORS["background"])
-        current_screen.draw()
-        pygame.display.flip()
+        if args.dirty_rects:
+            draw_dirty(screen, current_screen, profiler)
+        else:
+            with profiler.stage("draw"):
+                screen.fill(COLORS["background"])
+                current_screen.draw()
+            with profiler.stage("overlay"):
+                profiler.draw_overlay(screen)
+            with profiler.stage("display.flip"):
+                pygame.display.flip()
         
         # Cap the frame rate
-        clock.tick(FPS)
+        with profiler.stage("clock.tick"):
+            clock.tick(0 if args.turbo else FPS)
+        profiler.end_frame()
     
     # Clean up
+    ASSETS.shutdown()
+    if profiler.enabled:
+        profiler.export(args.profile_output)
+        print(f"Profile written to {args.profile_output}")
     pygame.quit()
     sys.exit()
 
@@ -0,0 +1,204 @@
+"""
+Shared asset cache that loads images and sounds on a background thread
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from ui.constants import ASSETS_PATH
+from ui.bundle import AssetBundle, pcm_samples
+
+class AssetManager:
+    """Loads images and sounds off the render thread and caches them by path
+
+    request_image()/request_sound() queue a file for loading and return at
+    once. Files are decoded on a worker thread, and poll() hands finished
+    images over on the main thread, converting them to the display format
+    once. Until an asset is ready (or if it fails to load) the getters
+    return None (or the default given), so callers draw or play
+    placeholders instead of waiting on disk I/O.
+
+    After open_bundle(), files packed in the bundle are decoded from the
+    memory-mapped bundle instead of being opened one by one.
+    """
+    def __init__(self, workers=1):
+        self.workers = workers
+        self.executor = None  # Started on the first request
+        self.lock = threading.Lock()
+        self.images = {}  # Path -> converted surface, or None if it failed
+        self.sounds = {}  # Path -> Sound, or None if it failed
+        self.scaled = {}  # (path, (width, height)) -> scaled surface
+        self.pending = {}  # (kind, path) -> Future
+        self.failed = set()
+        self.missing_dirs = set()  # Asset directories already reported missing
+        self.bundle = None
+        self.version = 0  # Bumped whenever poll() finishes loading something
+
+    def open_bundle(self, path):
+        """Load assets from a packed bundle (see ui/bundle.py) where possible"""
+        self.bundle = AssetBundle(path)
+
+    def get_bundle_name(self, path):
+        """Get the bundle entry for an asset path, or None if it is not packed"""
+        if self.bundle is None:
+            return None
+        name = os.path.relpath(path, ASSETS_PATH).replace(os.sep, "/")
+        return name if name in self.bundle else None
+
+    def load_image(self, path):
+        """Decode an image from the bundle or from its own file"""
+        name = self.get_bundle_name(path)
+        if name is None:
+            return pygame.image.load(path)
+        return pygame.image.load(self.bundle.open(name), name)
+
+    def load_sound(self, path):
+        """Decode a sound from the bundle or from its own file
+
+        Bundled WAVs that already match the mixer format are handed to the
+        mixer straight from the mapping as raw samples.
+        """
+        name = self.get_bundle_name(path)
+        if name is None:
+            return pygame.mixer.Sound(path)
+
+        mixer_format = pygame.mixer.get_init()
+        samples = pcm_samples(self.bundle.get_view(name), *mixer_format) if mixer_format else None
+        if samples is not None:
+            return pygame.mixer.Sound(buffer=samples)
+        return pygame.mixer.Sound(file=self.bundle.open(name))
+
+    def request_image(self, path):
+        """Start loading an image unless it is cached or already loading"""
+        self.request("image", path, self.load_image)
+
+    def request_sound(self, path):
+        """Start loading a sound unless it is cached or already loading"""
+        self.request("sound", path, self.load_sound)
+
+    def request(self, kind, path, loader):
+        """Queue a file for loading on the worker thread"""
+        cache = self.images if kind == "image" else self.sounds
+        with self.lock:
+            if path in cache or (kind, path) in self.pending:
+                return
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(self.workers, thread_name_prefix="assets")
+            self.pending[(kind, path)] = self.executor.submit(loader, path)
+
+    def poll(self):
+        """Move finished loads into the cache; returns True if anything finished
+
+        Call this once per frame from the main thread, since converting a
+        surface to the display format is not safe on the worker thread.
+        """
+        with self.lock:
+            if not self.pending:
+                return False
+            finished = [(key, future) for key, future in self.pending.items() if future.done()]
+            for key, future in finished:
+                del self.pending[key]
+                if future.exception() is not None:
+                    self.failed.add(key[1])
+        if not finished:
+            return False
+
+        for (kind, path), future in finished:
+            try:
+                asset = future.result()
+            except Exception as e:  # A corrupt file can fail in any decoder; use a placeholder
+                self.report_failure(path, e)
+                asset = None
+
+            if kind == "image":
+                self.images[path] = self.convert(asset) if asset is not None else None
+            else:
+                self.sounds[path] = asset
+        self.version += 1
+        return True
+
+    def report_failure(self, path, error):
+        """Warn about an asset that failed to load, once per missing directory"""
+        directory = os.path.dirname(path)
+        if isinstance(error, FileNotFoundError) and directory and not os.path.isdir(directory):
+            if directory not in self.missing_dirs:
+                self.missing_dirs.add(directory)
+                print(f"Warning: Could not find {directory}. Using placeholders.")
+            return
+        print(f"Warning: Could not load {path} ({error}). Using a placeholder.")
+
+    def convert(self, image):
+        """Convert an image to the display pixel format, keeping its transparency"""
+        if pygame.display.get_surface() is None:
+            return image  # No display yet (headless tools), keep the decoded format
+        if image.get_flags() & pygame.SRCALPHA or image.get_colorkey() is not None:
+            return image.convert_alpha()
+        return image.convert()
+
+    def wait(self):
+        """Block until every requested asset has loaded"""
+        while True:
+            with self.lock:
+                futures = list(self.pending.values())
+            if not futures:
+                return
+            for future in futures:
+                future.exception()  # Waits without raising
+            self.poll()
+
+    def load_failed(self, kind, path):
+        """Wait for a requested file to finish loading and tell whether it failed
+
+        Only call this from the worker for files requested earlier, since
+        it blocks until their load is done.
+        """
+        with self.lock:
+            future = self.pending.get((kind, path))
+            if future is None:
+                return path in self.failed
+        return future.exception() is not None
+
+    def is_loaded(self, path):
+        """Check whether a file has finished loading (or failed to)"""
+        return path in self.images or path in self.sounds
+
+    def get_image(self, path):
+        """Get a loaded image, or None while it is loading or if it failed"""
+        return self.images.get(path)
+
+    def get_scaled_image(self, path, size):
+        """Get a loaded image scaled to size, scaling it only the first time
+
+        Scaled copies keep the display format of the original, so drawing
+        them never needs a per-pixel conversion. Returns None until the
+        image has loaded.
+        """
+        size = (int(size[0]), int(size[1]))
+        key = (path, size)
+        image = self.scaled.get(key)
+        if image is None:
+            original = self.images.get(path)
+            if original is None:
+                return None
+            if original.get_size() == size:
+                image = original
+            else:
+                image = pygame.transform.scale(original, size)
+            self.scaled[key] = image
+        return image
+
+    def get_sound(self, path, default=None):
+        """Get a loaded sound, or default while it is loading or if it failed"""
+        sound = self.sounds.get(path)
+        return sound if sound is not None else default
+
+    def shutdown(self):
+        """Stop the worker thread, dropping loads that have not started"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        with self.lock:
+            self.pending.clear()
+
+# Shared asset cache used by every screen and component
+ASSETS = AssetManager()
@@ -0,0 +1,158 @@
+"""
+Sound effect playback on reserved mixer channels
+"""
+import math
+import time
+from array import array
+import pygame
+from ui.constants import SOUNDS_PATH, SOUND_EFFECTS, SOUND_CATEGORIES, SOUND_CHANNELS
+from ui.assets import ASSETS
+
+# Tones played when a sound file is missing: (start Hz, end Hz, seconds)
+PLACEHOLDER_TONES = {
+    "dice_roll": (900, 600, 0.08),
+    "move": (520, 520, 0.05),
+    "snake": (440, 110, 0.35),
+    "ladder": (330, 880, 0.35),
+    "win": (523, 1047, 0.6),
+}
+
+# Array typecode, peak value and zero level for each pygame.mixer sample size
+# (get_init() reports 32-bit float samples as -32)
+SAMPLE_FORMATS = {
+    8: ("B", 127, 128),
+    -8: ("b", 127, 0),
+    16: ("H", 32767, 32768),
+    -16: ("h", 32767, 0),
+    -32: ("f", 1.0, 0),
+}
+
+# Asset cache keys the synthesized tones are stored under
+PLACEHOLDER_PREFIX = "placeholder:"
+
+def synthesize_tone(start, end, duration, mixer_format, volume=0.3):
+    """Render a pitch sweep with a short fade in and a linear fade out
+
+    Returns the raw samples in the mixer's sample format, ready for
+    pygame.mixer.Sound(buffer=...).
+    """
+    frequency, size, channels = mixer_format
+    typecode, peak, zero = SAMPLE_FORMATS[size]
+    count = max(1, int(frequency * duration))
+    attack = max(1, int(frequency * 0.005))
+
+    samples = array(typecode)
+    phase = 0.0
+    for i in range(count):
+        t = i / count
+        phase += 2 * math.pi * (start + (end - start) * t) / frequency
+        level = math.sin(phase) * min(1.0, i / attack) * (1 - t) * volume
+        sample = zero + level * peak
+        samples.extend([sample if typecode == "f" else int(sample)] * channels)
+    return samples
+
+def render_placeholder_sound(path):
+    """Synthesize the stand-in tone for a placeholder path if its sound file failed
+
+    Runs on the asset worker after the file's own load, so tones are only
+    rendered for sounds that are really missing.
+    """
+    name = path[len(PLACEHOLDER_PREFIX):]
+    if not ASSETS.load_failed("sound", SOUNDS_PATH + SOUND_EFFECTS[name]):
+        return None
+    samples = synthesize_tone(*PLACEHOLDER_TONES[name], pygame.mixer.get_init())
+    return pygame.mixer.Sound(buffer=samples)
+
+class AudioManager:
+    """Plays sound effects on channels reserved for each group of effects
+
+    Every group (dice, moves, jumps, fanfare) owns a fixed set of mixer
+    channels, so a burst of one kind of sound can never take the channels
+    another needs. When all of a group's channels are busy the voice that
+    started first is cut off (voice stealing), and a sound retriggered
+    within min_retrigger seconds is skipped so fast play does not stutter.
+    Sounds are decoded once by the shared asset cache; until a file loads,
+    or if it is missing, a synthesized tone plays instead. Tones for missing
+    files are rendered on the asset worker, so play() never synthesizes.
+    """
+    def __init__(self, channels=SOUND_CHANNELS, categories=SOUND_CATEGORIES, min_retrigger=0.03):
+        self.channel_counts = channels
+        self.categories = categories
+        self.min_retrigger = min_retrigger
+        self.sound_paths = {name: SOUNDS_PATH + filename for name, filename in SOUND_EFFECTS.items()}
+        self.placeholder_paths = {name: PLACEHOLDER_PREFIX + name for name in PLACEHOLDER_TONES}
+        self.pools = None  # Category -> list of Channels, built once the mixer is up
+        self.started = {}  # Channel -> time its current voice started
+        self.last_played = {}  # Sound name -> time it last started
+
+    def load(self):
+        """Start loading every sound effect, with tones for any that fail, in the background"""
+        for path in self.sound_paths.values():
+            ASSETS.request_sound(path)
+        mixer_format = pygame.mixer.get_init()
+        if mixer_format and mixer_format[1] in SAMPLE_FORMATS:
+            for path in self.placeholder_paths.values():
+                ASSETS.request("sound", path, render_placeholder_sound)
+
+    def setup(self):
+        """Reserve the channel pools; returns False if there is no mixer"""
+        if self.pools is not None:
+            return True
+        if not pygame.mixer.get_init():
+            return False
+
+        # Reserved channels come first; keep a few free for anything else
+        total = sum(self.channel_counts.values())
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), total + 4))
+        pygame.mixer.set_reserved(total)
+
+        self.pools = {}
+        index = 0
+        for category, count in self.channel_counts.items():
+            self.pools[category] = [pygame.mixer.Channel(index + i) for i in range(count)]
+            index += count
+        return True
+
+    def get_sound(self, name):
+        """Get the decoded sound for an effect, or its placeholder tone
+
+        Returns None while neither has finished loading.
+        """
+        sound = ASSETS.get_sound(self.sound_paths[name])
+        return sound if sound is not None else ASSETS.get_sound(self.placeholder_paths[name])
+
+    def get_channel(self, category):
+        """Get an idle channel of a group, or steal the one playing longest"""
+        pool = self.pools[category]
+        for channel in pool:
+            if not channel.get_busy():
+                return channel
+        return min(pool, key=lambda channel: self.started.get(channel, 0.0))
+
+    def play(self, name):
+        """Play a sound effect on its group's channels"""
+        if not self.setup():
+            return None
+
+        now = time.monotonic()
+        if now - self.last_played.get(name, -math.inf) < self.min_retrigger:
+            return None
+
+        sound = self.get_sound(name)
+        if sound is None:
+            return None
+        channel = self.get_channel(self.categories[name])
+        channel.play(sound)
+        self.started[channel] = now
+        self.last_played[name] = now
+        return channel
+
+    def stop(self):
+        """Stop every sound effect"""
+        if self.pools is not None:
+            for pool in self.pools.values():
+                for channel in pool:
+                    channel.stop()
+
+# Shared sound effect player
+AUDIO = AudioManager()
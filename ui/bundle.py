@@ -0,0 +1,219 @@
+"""
+Packed asset bundle: every image and sound in one indexed, memory-mapped file
+
+Usage: python -m ui.bundle --source assets --output assets.bundle
+
+Layout (little endian):
+    header  8-byte magic, uint32 entry count
+    index   per entry: uint16 name length, uint64 offset, uint64 size, name
+    data    the original files back to back, each starting on an 8-byte boundary
+
+Entry names are paths relative to the assets directory, such as
+"images/dice_1.png" or "sounds/move.wav".
+"""
+import io
+import os
+import sys
+import mmap
+import struct
+import argparse
+from ui.constants import ASSETS_PATH, ASSET_BUNDLE
+
+BUNDLE_MAGIC = b"SLBUNDL1"
+HEADER = struct.Struct("<8sI")
+ENTRY = struct.Struct("<HQQ")
+ALIGNMENT = 8
+
+def build_bundle(source=ASSETS_PATH, output=ASSET_BUNDLE):
+    """Pack every file under source into a single bundle file
+
+    Returns the entry names in the order they were written.
+    """
+    names = []
+    for directory, subdirectories, files in os.walk(source):
+        subdirectories.sort()
+        for filename in sorted(files):
+            path = os.path.join(directory, filename)
+            names.append(os.path.relpath(path, source).replace(os.sep, "/"))
+
+    encoded = [name.encode("utf-8") for name in names]
+    index_size = sum(ENTRY.size + len(name) for name in encoded)
+    offset = HEADER.size + index_size
+
+    # Work out where each file goes before writing anything
+    entries = []
+    for name, encoded_name in zip(names, encoded):
+        offset += -offset % ALIGNMENT
+        size = os.path.getsize(os.path.join(source, name))
+        entries.append((encoded_name, offset, size))
+        offset += size
+
+    temporary = output + ".tmp"
+    with open(temporary, "wb") as f:
+        f.write(HEADER.pack(BUNDLE_MAGIC, len(entries)))
+        for encoded_name, offset, size in entries:
+            f.write(ENTRY.pack(len(encoded_name), offset, size))
+            f.write(encoded_name)
+        for name, (_, offset, _) in zip(names, entries):
+            f.write(bytes(offset - f.tell()))
+            with open(os.path.join(source, name), "rb") as asset:
+                f.write(asset.read())
+
+    # Replace the old bundle in one step so a running game never sees half a file
+    os.replace(temporary, output)
+    return names
+
+def pcm_samples(view, frequency, size, channels):
+    """Get a view of a WAV file's samples if they are already in the mixer format
+
+    size follows pygame.mixer.get_init(): 8 for unsigned 8-bit and -16 for
+    signed 16-bit samples. Returns None for anything else (compressed data,
+    another rate or channel count), which then has to be decoded normally.
+    """
+    if len(view) < 12 or view[0:4] != b"RIFF" or view[8:12] != b"WAVE":
+        return None
+
+    wav_format = None
+    position = 12
+    while position + 8 <= len(view):
+        chunk_id = bytes(view[position:position + 4])
+        chunk_size = struct.unpack_from("<I", view, position + 4)[0]
+        start = position + 8
+        if chunk_id == b"fmt " and chunk_size >= 16:
+            if start + 16 > len(view):
+                return None  # Truncated file; let the decoder report it
+            wav_format = struct.unpack_from("<HHIIHH", view, start)
+        elif chunk_id == b"data":
+            if wav_format is None:
+                return None
+            encoding, wav_channels, rate, _, _, bits = wav_format
+            bits = -bits if bits == 16 else bits  # 16-bit WAV samples are signed
+            if encoding != 1 or (rate, bits, wav_channels) != (frequency, size, channels):
+                return None
+            return view[start:min(start + chunk_size, len(view))]
+        position = start + chunk_size + chunk_size % 2  # Chunks are word aligned
+    return None
+
+class BundleReader(io.RawIOBase):
+    """Read-only file object over a slice of the mapped bundle
+
+    Reads copy straight from the mapping into the caller's buffer, so
+    pygame can decode an entry without the whole file being copied first.
+    """
+    def __init__(self, view):
+        self.view = view
+        self.position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        count = min(len(buffer), len(self.view) - self.position)
+        if count <= 0:
+            return 0
+        buffer[:count] = self.view[self.position:self.position + count]
+        self.position += count
+        return count
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += len(self.view)
+        self.position = max(0, offset)
+        return self.position
+
+    def tell(self):
+        return self.position
+
+class AssetBundle:
+    """Memory-mapped bundle whose entries are decoded on demand
+
+    Only the index is read when the bundle is opened. An entry's pages are
+    read the first time it is decoded, with no file open per asset.
+    """
+    def __init__(self, path=ASSET_BUNDLE):
+        self.path = path
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.map)
+
+        try:
+            self.entries = self.read_index()
+        except ValueError as e:
+            self.close()
+            raise ValueError(f"{path} is not a valid asset bundle ({e})") from None
+
+    def read_index(self):
+        """Read the entry table, checking every entry lies inside the file
+
+        A truncated or corrupt bundle raises ValueError instead of handing
+        out views past the end of the mapping.
+        """
+        length = len(self.map)
+        if length < HEADER.size:
+            raise ValueError("file is shorter than the header")
+        magic, count = HEADER.unpack_from(self.map, 0)
+        if magic != BUNDLE_MAGIC:
+            raise ValueError("wrong magic")
+
+        entries = {}
+        position = HEADER.size
+        for _ in range(count):
+            if position + ENTRY.size > length:
+                raise ValueError("index runs past the end of the file")
+            name_length, offset, size = ENTRY.unpack_from(self.map, position)
+            position += ENTRY.size
+            if position + name_length > length:
+                raise ValueError("index runs past the end of the file")
+            name = bytes(self.map[position:position + name_length]).decode("utf-8")  # UnicodeDecodeError is a ValueError
+            position += name_length
+            if offset + size > length:
+                raise ValueError(f"entry {name} runs past the end of the file")
+            entries[name] = (offset, size)
+        return entries
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def get_view(self, name):
+        """Get a zero-copy view of an entry's bytes"""
+        offset, size = self.entries[name]
+        return self.view[offset:offset + size]
+
+    def open(self, name):
+        """Get a file object reading an entry straight from the mapping"""
+        return BundleReader(self.get_view(name))
+
+    def close(self):
+        """Unmap the bundle (views handed out must no longer be in use)"""
+        self.view.release()
+        self.map.close()
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Pack the game assets into a single bundle file")
+    parser.add_argument("--source", default=ASSETS_PATH, help="assets directory to pack")
+    parser.add_argument("--output", default=ASSET_BUNDLE, help="bundle file to write")
+    parser.add_argument("--list", action="store_true", help="list the entries of an existing bundle instead")
+    return parser.parse_args()
+
+def main():
+    """Build a bundle, or list the contents of one"""
+    args = parse_args()
+    if args.list:
+        bundle = AssetBundle(args.output)
+        for name, (offset, size) in bundle.entries.items():
+            print(f"{offset:>10} {size:>10}  {name}")
+        bundle.close()
+        return 0
+
+    names = build_bundle(args.source, args.output)
+    print(f"Packed {len(names)} files into {args.output} ({os.path.getsize(args.output)} bytes)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
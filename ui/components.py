@@ -5,10 +5,13 @@ import pygame
 import math
 import random
 from ui.constants import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, COLORS, FONT_SIZES, FONTS,
-    BOARD_SIZE, BOARD_WIDTH, BOARD_HEIGHT, BOARD_MARGIN,
-    SQUARE_SIZE, SNAKES, LADDERS, BILLIONAIRE_SNAKES
+    SCREEN_WIDTH, SCREEN_HEIGHT, COLORS,
+    BOARD_WIDTH, BOARD_MARGIN, LOGIC_TICK, IMAGES_PATH, PLAYER_COLORS, PLAYER_TYPES
 )
+from ui.geometry import get_board_geometry
+from ui.text_cache import render_text
+from ui.fonts import get_font
+from ui.assets import ASSETS
 
 class Button:
     """Button UI component"""
@@ -18,11 +21,22 @@ class Button:
         self.color = color
         self.text_color = text_color
         self.hover = False
-        self.font = pygame.font.SysFont(FONTS["button"], FONT_SIZES["button"])
+        self.dirty = True
+        self.font = get_font("button")
         
     def update(self, mouse_pos):
         """Update button state based on mouse position"""
-        self.hover = self.rect.collidepoint(mouse_pos)
+        hover = bool(self.rect.collidepoint(mouse_pos))
+        if hover != self.hover:
+            self.hover = hover
+            self.dirty = True
+            
+    def get_dirty_rects(self):
+        """Get the areas that changed since the last frame"""
+        if not self.dirty:
+            return []
+        self.dirty = False
+        return [self.rect]
         
     def draw(self, surface):
         """Draw the button"""
@@ -32,7 +46,7 @@ class Button:
         pygame.draw.rect(surface, COLORS["text"], self.rect, width=2, border_radius=10)
         
         # Draw button text
-        text_surface = self.font.render(self.text, True, self.text_color)
+        text_surface = render_text(self.font, self.text, self.text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         surface.blit(text_surface, text_rect)
         
@@ -42,121 +56,172 @@ class Button:
 
 class Board:
     """Game board UI component"""
-    def __init__(self, surface):
+    def __init__(self, surface, layout):
         self.surface = surface
-        self.rect = pygame.Rect(BOARD_MARGIN, BOARD_MARGIN, BOARD_WIDTH, BOARD_HEIGHT)
-        self.font = pygame.font.SysFont(FONTS["small"], FONT_SIZES["small"])
+        self.font = get_font("small")
+        
+        # Pre-rendered static layer, rebuilt when the layout or window size changes
+        self.static_layer = None
+        self.static_layer_pos = (0, 0)
+        self.static_layer_key = None
+        self.dirty = True
+        
+        self.set_layout(layout)
+        
+    def load_images(self):
+        """Request the snake and ladder images for this layout
+        
+        They load in the background; placeholder graphics are drawn until
+        update() sees them arrive.
+        """
+        self.snake_image_paths = {
+            pos: IMAGES_PATH + filename for pos, filename in self.layout.billionaire_snakes.items()
+        }
+        self.ladder_image_path = IMAGES_PATH + "ladder.png"
+        for path in self.snake_image_paths.values():
+            ASSETS.request_image(path)
+        ASSETS.request_image(self.ladder_image_path)
         
-        # Load snake and ladder images
+        self.assets_version = None
+        self.pending_images = set(self.snake_image_paths.values()) | {self.ladder_image_path}
         self.snake_images = {}
-        self.ladder_image = None
-        
-        try:
-            # Try to load billionaire snake images
-            for pos, filename in BILLIONAIRE_SNAKES.items():
-                self.snake_images[pos] = pygame.image.load(f"assets/images/{filename}")
-                self.snake_images[pos] = pygame.transform.scale(
-                    self.snake_images[pos], 
-                    (SQUARE_SIZE * 0.8, SQUARE_SIZE * 0.8)
+        self.ladder_images = {}
+        self.update_images()
+        
+    def update_images(self):
+        """Pick up images that finished loading, pre-scaled for this layout
+        
+        Snake heads are scaled to the square size and the ladder image is
+        scaled and rotated to fit each ladder, so building the static layer
+        only blits finished surfaces.
+        """
+        if not self.pending_images or self.assets_version == ASSETS.version:
+            return
+        self.assets_version = ASSETS.version
+        
+        loaded = {path for path in self.pending_images if ASSETS.is_loaded(path)}
+        if not loaded:
+            return
+        self.pending_images -= loaded
+        
+        head_size = (self.square_size * 0.8, self.square_size * 0.8)
+        for pos, path in self.snake_image_paths.items():
+            if path in loaded:
+                image = ASSETS.get_scaled_image(path, head_size)
+                if image is not None:
+                    self.snake_images[pos] = image
+        
+        if self.ladder_image_path in loaded:
+            for bottom, ladder in self.geometry.ladders.items():
+                # The ladder image stands upright, so stretch its height to
+                # the ladder and turn it from vertical to the ladder's angle
+                image = ASSETS.get_scaled_image(
+                    self.ladder_image_path, 
+                    (self.square_size * 0.6, max(1, ladder["length"] * 0.8))
                 )
-            
-            # Load ladder image
-            self.ladder_image = pygame.image.load("assets/images/ladder.png")
-            self.ladder_image = pygame.transform.scale(
-                self.ladder_image, 
-                (SQUARE_SIZE * 0.6, SQUARE_SIZE * 2)
-            )
-        except:
-            print("Warning: Could not load snake/ladder images. Using placeholder graphics.")
-            # Create placeholder graphics
-            for pos in SNAKES:
-                self.snake_images[pos] = None
-            self.ladder_image = None
+                if image is None:
+                    break
+                self.ladder_images[bottom] = pygame.transform.rotate(image, -(ladder["angle"] + 90))
+        self.invalidate()
+        
+    def update(self):
+        """Redraw the board once newly loaded images are available"""
+        self.update_images()
+        
+    def get_dirty_rects(self):
+        """Get the area covered by the static layer if it needs redrawing"""
+        if not self.dirty:
+            return []
+        self.dirty = False
+        return [self.bounds]
         
     def get_square_position(self, square_number):
         """Get the pixel position of a square on the board"""
-        if square_number < 1 or square_number > 100:
-            return (0, 0)
-            
-        # Convert square number to row and column
-        # Note: Row 0 is at the bottom, Row 9 is at the top
-        row = 9 - (square_number - 1) // 10
-        
-        # Column depends on the row (alternating left-to-right and right-to-left)
-        if row % 2 == 1:  # Odd rows go left to right
-            col = (square_number - 1) % 10
-        else:  # Even rows go right to left
-            col = 9 - (square_number - 1) % 10
-            
-        # Convert to pixel position
-        x = self.rect.left + col * SQUARE_SIZE + SQUARE_SIZE // 2
-        y = self.rect.top + row * SQUARE_SIZE + SQUARE_SIZE // 2
-        
-        return (x, y)
+        return self.geometry.square_center(square_number)
+        
+    def set_layout(self, layout):
+        """Switch to a different board layout
+        
+        Any grid size fits the same board area, so squares shrink as the
+        grid grows.
+        """
+        self.layout = layout
+        self.square_size = BOARD_WIDTH // layout.size
+        board_width = self.square_size * layout.size
+        self.rect = pygame.Rect(BOARD_MARGIN, BOARD_MARGIN, board_width, board_width)
+        self.bounds = self.rect.inflate(BOARD_MARGIN * 2, BOARD_MARGIN * 2)  # Snakes can curve past the edges
+        self.geometry = get_board_geometry(layout, self.rect.left, self.rect.top, self.square_size)
+        self.load_images()
+        self.invalidate()
+        
+    def invalidate(self):
+        """Force the static board layer to be rebuilt on the next draw"""
+        self.static_layer = None
+        self.dirty = True
+        
+    def build_static_layer(self, size):
+        """Pre-render the board, snakes and ladders into an off-screen surface"""
+        layer = pygame.Surface(size)
+        layer.fill(COLORS["background"])
+        self.draw_static(layer)
+        
+        # Keep only the area around the board (snakes can curve past its edges)
+        bounds = self.bounds.clip(layer.get_rect())
+        self.static_layer = layer.subsurface(bounds).copy().convert()
+        self.static_layer_pos = bounds.topleft
+        self.static_layer_key = (self.layout, size)
         
     def draw(self, surface):
-        """Draw the game board"""
+        """Draw the game board from the cached static layer"""
+        size = surface.get_size()
+        if self.static_layer is None or self.static_layer_key != (self.layout, size):
+            self.build_static_layer(size)
+        surface.blit(self.static_layer, self.static_layer_pos)
+        
+    def draw_static(self, surface):
+        """Draw the parts of the board that do not change during a game"""
         # Draw board background
         pygame.draw.rect(surface, COLORS["text"], self.rect, width=2)
         
         # Draw squares
-        for row in range(BOARD_SIZE):
-            for col in range(BOARD_SIZE):
-                # Calculate square number
-                if row % 2 == 0:  # Even rows (0, 2, 4, 6, 8)
-                    square_num = 100 - row * 10 - col
-                else:  # Odd rows (1, 3, 5, 7, 9)
-                    square_num = 100 - row * 10 - 9 + col
+        size = self.layout.size
+        square_size = self.square_size
+        for row in range(size):
+            for col in range(size):
+                # Calculate square number (rows alternate, the bottom row runs left to right)
+                rows_below = size - 1 - row
+                if rows_below % 2 == 0:
+                    square_num = rows_below * size + col + 1
+                else:
+                    square_num = rows_below * size + size - col
                 
                 # Calculate square position
-                x = self.rect.left + col * SQUARE_SIZE
-                y = self.rect.top + row * SQUARE_SIZE
+                x = self.rect.left + col * square_size
+                y = self.rect.top + row * square_size
                 
                 # Draw square
                 color = COLORS["square_light"] if (row + col) % 2 == 0 else COLORS["square_dark"]
-                pygame.draw.rect(surface, color, (x, y, SQUARE_SIZE, SQUARE_SIZE))
+                pygame.draw.rect(surface, color, (x, y, square_size, square_size))
                 
                 # Draw square number
-                text = self.font.render(str(square_num), True, COLORS["text"])
-                text_rect = text.get_rect(center=(x + SQUARE_SIZE // 2, y + SQUARE_SIZE // 2))
+                text = render_text(self.font, str(square_num), COLORS["text"])
+                text_rect = text.get_rect(center=(x + square_size // 2, y + square_size // 2))
                 surface.blit(text, text_rect)
         
         # Draw snakes
-        for head, tail in SNAKES.items():
-            head_pos = self.get_square_position(head)
-            tail_pos = self.get_square_position(tail)
-            
-            # Draw snake body (a curved line with gradient color)
-            control_point = (
-                (head_pos[0] + tail_pos[0]) // 2 + random.randint(-50, 50),
-                (head_pos[1] + tail_pos[1]) // 2 + random.randint(-50, 50)
-            )
-            
-            # Draw a quadratic bezier curve with gradient
-            points = []
-            for t in range(0, 101, 5):
-                t = t / 100
-                x = (1 - t) ** 2 * head_pos[0] + 2 * (1 - t) * t * control_point[0] + t ** 2 * tail_pos[0]
-                y = (1 - t) ** 2 * head_pos[1] + 2 * (1 - t) * t * control_point[1] + t ** 2 * tail_pos[1]
-                points.append((int(x), int(y)))
+        for head, snake in self.geometry.snakes.items():
+            head_pos = snake["head"]
+            tail_pos = snake["tail"]
+            points = snake["points"]
             
             # Draw snake body with thickness and gradient
             if len(points) >= 2:
-                # Draw snake body with gradient effect
-                for i in range(len(points) - 1):
-                    # Calculate gradient color
-                    t = i / (len(points) - 1)
-                    r = int(255 - t * 100)
-                    g = int(80 - t * 40)
-                    b = int(80 - t * 40)
-                    color = (r, g, b)
-                    
-                    # Draw thicker line segment
+                for i, color in enumerate(snake["colors"]):
                     pygame.draw.line(surface, color, points[i], points[i+1], width=8)
                 
                 # Draw snake scales (small circles along the body)
-                for i in range(1, len(points) - 1, 2):
-                    pygame.draw.circle(surface, (255, 100, 100), points[i], 4)
+                for point in snake["scales"]:
+                    pygame.draw.circle(surface, (255, 100, 100), point, 4)
             
             # Draw snake head (billionaire image if available)
             if head in self.snake_images and self.snake_images[head] is not None:
@@ -164,11 +229,11 @@ class Board:
                 surface.blit(self.snake_images[head], img_rect)
             else:
                 # Draw improved snake head
-                pygame.draw.circle(surface, (255, 60, 60), head_pos, SQUARE_SIZE // 3)
-                pygame.draw.circle(surface, (200, 30, 30), head_pos, SQUARE_SIZE // 3 - 3)
+                pygame.draw.circle(surface, (255, 60, 60), head_pos, self.square_size // 3)
+                pygame.draw.circle(surface, (200, 30, 30), head_pos, self.square_size // 3 - 3)
                 
                 # Draw eyes
-                eye_offset = SQUARE_SIZE // 8
+                eye_offset = self.square_size // 8
                 pygame.draw.circle(surface, (255, 255, 255), 
                                   (head_pos[0] - eye_offset, head_pos[1] - eye_offset), 5)
                 pygame.draw.circle(surface, (255, 255, 255), 
@@ -181,101 +246,46 @@ class Board:
                 # Draw tongue
                 tongue_points = [
                     head_pos,
-                    (head_pos[0], head_pos[1] + SQUARE_SIZE // 4),
-                    (head_pos[0] - SQUARE_SIZE // 6, head_pos[1] + SQUARE_SIZE // 3),
-                    (head_pos[0] + SQUARE_SIZE // 6, head_pos[1] + SQUARE_SIZE // 3)
+                    (head_pos[0], head_pos[1] + self.square_size // 4),
+                    (head_pos[0] - self.square_size // 6, head_pos[1] + self.square_size // 3),
+                    (head_pos[0] + self.square_size // 6, head_pos[1] + self.square_size // 3)
                 ]
                 pygame.draw.line(surface, (255, 0, 0), tongue_points[0], tongue_points[1], 3)
                 pygame.draw.line(surface, (255, 0, 0), tongue_points[1], tongue_points[2], 3)
                 pygame.draw.line(surface, (255, 0, 0), tongue_points[1], tongue_points[3], 3)
             
             # Draw snake tail
-            pygame.draw.circle(surface, (180, 50, 50), tail_pos, SQUARE_SIZE // 5)
-            pygame.draw.circle(surface, (150, 30, 30), tail_pos, SQUARE_SIZE // 5 - 2)
+            pygame.draw.circle(surface, (180, 50, 50), tail_pos, self.square_size // 5)
+            pygame.draw.circle(surface, (150, 30, 30), tail_pos, self.square_size // 5 - 2)
         
         # Draw ladders
-        for bottom, top in LADDERS.items():
-            bottom_pos = self.get_square_position(bottom)
-            top_pos = self.get_square_position(top)
-            
-            if self.ladder_image:
-                # Calculate angle and distance
-                dx = top_pos[0] - bottom_pos[0]
-                dy = top_pos[1] - bottom_pos[1]
-                angle = math.degrees(math.atan2(dy, dx))
-                distance = math.sqrt(dx ** 2 + dy ** 2)
-                
-                # Scale ladder image to match distance
-                scaled_ladder = pygame.transform.scale(
-                    self.ladder_image, 
-                    (int(distance * 0.8), self.ladder_image.get_height())
-                )
-                
-                # Rotate ladder image
-                rotated_ladder = pygame.transform.rotate(scaled_ladder, angle - 90)
-                
-                # Calculate position
-                mid_x = (bottom_pos[0] + top_pos[0]) // 2
-                mid_y = (bottom_pos[1] + top_pos[1]) // 2
-                ladder_rect = rotated_ladder.get_rect(center=(mid_x, mid_y))
-                
-                # Draw ladder
-                surface.blit(rotated_ladder, ladder_rect)
+        for bottom, ladder in self.geometry.ladders.items():
+            ladder_image = self.ladder_images.get(bottom)
+            if ladder_image is not None:
+                # Draw the pre-rotated ladder image centered between its ends
+                mid_x = (ladder["bottom"][0] + ladder["top"][0]) // 2
+                mid_y = (ladder["bottom"][1] + ladder["top"][1]) // 2
+                surface.blit(ladder_image, ladder_image.get_rect(center=(mid_x, mid_y)))
             else:
-                # Draw improved ladder
-                # Calculate direction and length
-                dx = top_pos[0] - bottom_pos[0]
-                dy = top_pos[1] - bottom_pos[1]
-                length = math.sqrt(dx ** 2 + dy ** 2)
+                # Draw side rails with gradient
+                for color, left_start, left_end, right_start, right_end in ladder["rails"]:
+                    pygame.draw.line(surface, color, left_start, left_end, width=4)
+                    pygame.draw.line(surface, color, right_start, right_end, width=4)
                 
-                if length > 0:
-                    # Calculate perpendicular offset for rails
-                    offset_x = -dy * 8 / length
-                    offset_y = dx * 8 / length
-                    
-                    # Draw side rails with gradient
-                    for i in range(100):
-                        t = i / 99
-                        # Start and end points for this segment
-                        x1 = bottom_pos[0] + dx * t
-                        y1 = bottom_pos[1] + dy * t
-                        x2 = bottom_pos[0] + dx * (t + 0.01)
-                        y2 = bottom_pos[1] + dy * (t + 0.01)
-                        
-                        # Calculate gradient color (gold to light gold)
-                        r = int(180 + t * 75)
-                        g = int(140 + t * 60)
-                        b = int(20 + t * 40)
-                        color = (r, g, b)
-                        
-                        # Draw rail segments
-                        pygame.draw.line(
-                            surface, 
-                            color, 
-                            (x1 - offset_x, y1 - offset_y),
-                            (x2 - offset_x, y2 - offset_y),
-                            width=4
-                        )
-                        pygame.draw.line(
-                            surface, 
-                            color, 
-                            (x1 + offset_x, y1 + offset_y),
-                            (x2 + offset_x, y2 + offset_y),
-                            width=4
-                        )
-                    
-                    # Draw rungs
-                    num_rungs = max(3, int(length / 40))
-                    for i in range(num_rungs):
-                        t = (i + 0.5) / num_rungs
-                        x1 = bottom_pos[0] + dx * t - offset_x
-                        y1 = bottom_pos[1] + dy * t - offset_y
-                        x2 = bottom_pos[0] + dx * t + offset_x
-                        y2 = bottom_pos[1] + dy * t + offset_y
-                        
-                        # Draw rung with 3D effect
-                        pygame.draw.line(surface, (180, 140, 20), (x1, y1), (x2, y2), width=5)
-                        pygame.draw.line(surface, (220, 180, 60), (x1, y1), (x2, y2), width=3)
+                # Draw rungs with 3D effect
+                for start, end in ladder["rungs"]:
+                    pygame.draw.line(surface, (180, 140, 20), start, end, width=5)
+                    pygame.draw.line(surface, (220, 180, 60), start, end, width=3)
+
+# Dot layout for each dice face, as fractions of the dice size
+DICE_DOT_POSITIONS = {
+    1: [(0.5, 0.5)],
+    2: [(0.25, 0.25), (0.75, 0.75)],
+    3: [(0.25, 0.25), (0.5, 0.5), (0.75, 0.75)],
+    4: [(0.25, 0.25), (0.25, 0.75), (0.75, 0.25), (0.75, 0.75)],
+    5: [(0.25, 0.25), (0.25, 0.75), (0.5, 0.5), (0.75, 0.25), (0.75, 0.75)],
+    6: [(0.25, 0.25), (0.25, 0.5), (0.25, 0.75), (0.75, 0.25), (0.75, 0.5), (0.75, 0.75)]
+}
 
 class Dice:
     """Dice UI component with enhanced animation"""
@@ -290,20 +300,50 @@ class Dice:
         self.roll_speed = 2  # Frames per dice change
         self.roll_angle = 0  # For rotation animation
         self.roll_scale = 1.0  # For bounce animation
-        
-        # Load dice images
-        self.dice_images = []
-        try:
-            for i in range(1, 7):
-                img = pygame.image.load(f"assets/images/dice_{i}.png")
-                img = pygame.transform.scale(img, (self.size, self.size))
-                self.dice_images.append(img)
-        except:
-            print("Warning: Could not load dice images. Using placeholder graphics.")
-            self.dice_images = [None] * 6
+        self.dirty = True
+        self.rng = random.Random()  # Cosmetic only, never the game's dice RNG
+        
+        # Area covered by the dice at its largest scale and any rotation
+        bounds_size = int(self.size * 1.3 * 1.5)
+        self.bounds = pygame.Rect(0, 0, bounds_size, bounds_size)
+        self.bounds.center = (self.x + self.size // 2, self.y + self.size // 2)
+        
+        # Request dice images; placeholder faces are drawn until they load
+        self.image_paths = [f"{IMAGES_PATH}dice_{i}.png" for i in range(1, 7)]
+        for path in self.image_paths:
+            ASSETS.request_image(path)
+        self.dice_images = [None] * 6
+        self.bake_faces()
+        
+    def bake_faces(self):
+        """Bake every face at rest and every roll animation frame up front so
+        drawing the dice is a single blit"""
+        self.face_surfaces = [self.render_face(value) for value in range(1, 7)]
+        self.roll_frame_cache = {}
+        for roll_frames in range(1, self.max_roll_frames + 1):
+            angle, scale = self.get_roll_transform(roll_frames)
+            for value in range(1, 7):
+                self.get_roll_frame(value, angle, int(self.size * scale))
+        self.dirty = True
+        
+    def update_images(self):
+        """Re-bake the faces once all the dice images have finished loading"""
+        if not all(ASSETS.is_loaded(path) for path in self.image_paths):
+            return
+        images = [ASSETS.get_scaled_image(path, (self.size, self.size)) for path in self.image_paths]
+        self.image_paths = []  # Nothing left to wait for
+        if None in images:
+            # Keep the placeholders rather than mixing them with images
+            return
+        self.dice_images = images
+        self.bake_faces()
         
     def update(self, value):
         """Update dice state"""
+        if self.image_paths:
+            self.update_images()
+        was_rolling = self.rolling
+        
         if value != self.value and not self.rolling:
             self.value = value
             self.rolling = True
@@ -315,164 +355,211 @@ class Dice:
             self.roll_frames += 1
             
             # Update rotation and scale for animation
-            self.roll_angle = (self.roll_frames * 15) % 360
-            
-            # Bounce effect
-            progress = self.roll_frames / self.max_roll_frames
-            if progress < 0.5:
-                self.roll_scale = 1.0 + 0.3 * math.sin(progress * math.pi)
-            else:
-                self.roll_scale = 1.0
+            self.roll_angle, self.roll_scale = self.get_roll_transform(self.roll_frames)
             
             if self.roll_frames >= self.max_roll_frames:
                 self.rolling = False
                 self.roll_angle = 0
                 self.roll_scale = 1.0
         
+        # Redraw while rolling and once more to clear the last animation frame
+        if self.rolling or was_rolling:
+            self.dirty = True
+            
+    def get_roll_transform(self, roll_frames):
+        """Get the rotation angle and bounce scale for a frame of the roll animation"""
+        angle = (roll_frames * 15) % 360
+        
+        # Bounce effect
+        progress = roll_frames / self.max_roll_frames
+        if progress < 0.5:
+            scale = 1.0 + 0.3 * math.sin(progress * math.pi)
+        else:
+            scale = 1.0
+        return angle, scale
+        
+    def get_dirty_rects(self):
+        """Get the areas that changed since the last frame"""
+        if not self.dirty:
+            return []
+        self.dirty = False
+        return [self.bounds]
+        
+    def get_roll_frame(self, value, angle, dice_size):
+        """Get a rotated and scaled dice face, rendering it on first use"""
+        key = (value, angle, dice_size)
+        frame = self.roll_frame_cache.get(key)
+        if frame is not None:
+            return frame
+        
+        if self.dice_images[value - 1] is not None:
+            # Scale the dice image
+            dice_surface = pygame.transform.scale(self.dice_images[value - 1], (dice_size, dice_size))
+        else:
+            # Create a surface for the placeholder dice
+            dice_surface = pygame.Surface((dice_size, dice_size), pygame.SRCALPHA)
+            pygame.draw.rect(dice_surface, (255, 255, 255), 
+                            (0, 0, dice_size, dice_size), border_radius=dice_size//8)
+            pygame.draw.rect(dice_surface, COLORS["text"], 
+                            (0, 0, dice_size, dice_size), width=2, border_radius=dice_size//8)
+            
+            # Draw dots based on value
+            for pos in DICE_DOT_POSITIONS[value]:
+                x = pos[0] * dice_size
+                y = pos[1] * dice_size
+                pygame.draw.circle(dice_surface, COLORS["text"], (x, y), dice_size // 10)
+        
+        # Rotate the dice
+        frame = pygame.transform.rotate(dice_surface, angle).convert_alpha()
+        self.roll_frame_cache[key] = frame
+        return frame
+        
+    def render_face(self, value):
+        """Render a dice face at rest"""
+        if self.dice_images[value - 1] is not None:
+            return self.dice_images[value - 1]
+        
+        # Draw placeholder dice (with room for the dot shadows)
+        face = pygame.Surface((self.size + 2, self.size + 2), pygame.SRCALPHA)
+        pygame.draw.rect(face, (255, 255, 255), 
+                        (0, 0, self.size, self.size), border_radius=10)
+        pygame.draw.rect(face, COLORS["text"], 
+                        (0, 0, self.size, self.size), width=2, border_radius=10)
+        
+        # Add a subtle gradient effect
+        for i in range(10):
+            pygame.draw.rect(face, (255, 255, 255), 
+                            (i, i, self.size - i*2, self.size - i*2), 
+                            border_radius=10-i if 10-i > 0 else 0)
+        
+        # Draw dots based on value
+        for pos in DICE_DOT_POSITIONS[value]:
+            x = pos[0] * self.size
+            y = pos[1] * self.size
+            # Draw dot with shadow effect
+            pygame.draw.circle(face, (30, 30, 30), (x+2, y+2), self.size // 10)
+            pygame.draw.circle(face, COLORS["text"], (x, y), self.size // 10)
+        
+        return face.convert_alpha()
+        
     def draw(self, surface):
         """Draw the dice with animation"""
         if self.rolling:
             # Show random dice face during rolling animation
             if self.roll_frames % self.roll_speed == 0:
-                random_value = random.randint(1, 6)
+                random_value = self.rng.randint(1, 6)
             else:
                 random_value = (self.roll_frames // self.roll_speed) % 6 + 1
             
-            # Apply rotation and scaling
+            # Draw the pre-rendered rotated and scaled face
             dice_size = int(self.size * self.roll_scale)
-            x_offset = (dice_size - self.size) // 2
-            y_offset = (dice_size - self.size) // 2
-            
-            if 0 < random_value <= len(self.dice_images) and self.dice_images[random_value - 1] is not None:
-                # Scale the dice image
-                scaled_dice = pygame.transform.scale(self.dice_images[random_value - 1], (dice_size, dice_size))
-                # Rotate the dice image
-                rotated_dice = pygame.transform.rotate(scaled_dice, self.roll_angle)
-                # Get the rect for the rotated image
-                rect = rotated_dice.get_rect(center=(self.x + self.size//2, self.y + self.size//2))
-                # Draw the dice
-                surface.blit(rotated_dice, rect)
-            else:
-                # Draw placeholder dice with animation
-                rect = pygame.Rect(
-                    self.x - x_offset, 
-                    self.y - y_offset, 
-                    dice_size, 
-                    dice_size
-                )
-                
-                # Create a surface for the dice
-                dice_surface = pygame.Surface((dice_size, dice_size), pygame.SRCALPHA)
-                pygame.draw.rect(dice_surface, (255, 255, 255), 
-                                (0, 0, dice_size, dice_size), border_radius=dice_size//8)
-                pygame.draw.rect(dice_surface, COLORS["text"], 
-                                (0, 0, dice_size, dice_size), width=2, border_radius=dice_size//8)
-                
-                # Draw dots based on value
-                dot_positions = {
-                    1: [(0.5, 0.5)],
-                    2: [(0.25, 0.25), (0.75, 0.75)],
-                    3: [(0.25, 0.25), (0.5, 0.5), (0.75, 0.75)],
-                    4: [(0.25, 0.25), (0.25, 0.75), (0.75, 0.25), (0.75, 0.75)],
-                    5: [(0.25, 0.25), (0.25, 0.75), (0.5, 0.5), (0.75, 0.25), (0.75, 0.75)],
-                    6: [(0.25, 0.25), (0.25, 0.5), (0.25, 0.75), (0.75, 0.25), (0.75, 0.5), (0.75, 0.75)]
-                }
-                
-                if random_value in dot_positions:
-                    for pos in dot_positions[random_value]:
-                        x = pos[0] * dice_size
-                        y = pos[1] * dice_size
-                        pygame.draw.circle(dice_surface, COLORS["text"], (x, y), dice_size // 10)
-                
-                # Rotate the dice surface
-                rotated_dice = pygame.transform.rotate(dice_surface, self.roll_angle)
-                # Get the rect for the rotated surface
-                rot_rect = rotated_dice.get_rect(center=(self.x + self.size//2, self.y + self.size//2))
-                # Draw the dice
-                surface.blit(rotated_dice, rot_rect)
-        else:
+            rotated_dice = self.get_roll_frame(random_value, self.roll_angle, dice_size)
+            rect = rotated_dice.get_rect(center=(self.x + self.size//2, self.y + self.size//2))
+            surface.blit(rotated_dice, rect)
+        elif 0 < self.value <= len(self.face_surfaces):
             # Draw the final dice value
-            value = self.value
+            surface.blit(self.face_surfaces[self.value - 1], (self.x, self.y))
+
+class GlowAtlas:
+    """Pre-rendered token glow frames packed side by side into one surface"""
+    # Glow sizes covered by the atlas (PlayerToken.glow_size moves in 0.2 steps
+    # and overshoots its 0-5 range by one step either way)
+    MIN_GLOW = -0.2
+    MAX_GLOW = 5.4
+    GLOW_STEP = 0.2
+    
+    def __init__(self, color, size):
+        self.frames = []  # (area in the atlas, glow radius) per glow step
+        
+        num_frames = int(round((self.MAX_GLOW - self.MIN_GLOW) / self.GLOW_STEP)) + 1
+        cell_size = int((size + self.MAX_GLOW) * 2) + 1
+        self.surface = pygame.Surface((cell_size * num_frames, cell_size), pygame.SRCALPHA)
+        
+        for k in range(num_frames):
+            glow_radius = size + self.MIN_GLOW + k * self.GLOW_STEP
+            cell_x = k * cell_size
             
-            # Draw dice
-            if 0 < value <= len(self.dice_images) and self.dice_images[value - 1] is not None:
-                # Draw dice image
-                surface.blit(self.dice_images[value - 1], (self.x, self.y))
-            else:
-                # Draw placeholder dice
-                pygame.draw.rect(surface, (255, 255, 255), 
-                                (self.x, self.y, self.size, self.size), border_radius=10)
-                pygame.draw.rect(surface, COLORS["text"], 
-                                (self.x, self.y, self.size, self.size), width=2, border_radius=10)
-                
-                # Add a subtle gradient effect
-                for i in range(10):
-                    pygame.draw.rect(surface, (255, 255, 255, 150 - i*15), 
-                                    (self.x + i, self.y + i, self.size - i*2, self.size - i*2), 
-                                    border_radius=10-i if 10-i > 0 else 0)
-                
-                # Draw dots based on value
-                dot_positions = {
-                    1: [(0.5, 0.5)],
-                    2: [(0.25, 0.25), (0.75, 0.75)],
-                    3: [(0.25, 0.25), (0.5, 0.5), (0.75, 0.75)],
-                    4: [(0.25, 0.25), (0.25, 0.75), (0.75, 0.25), (0.75, 0.75)],
-                    5: [(0.25, 0.25), (0.25, 0.75), (0.5, 0.5), (0.75, 0.25), (0.75, 0.75)],
-                    6: [(0.25, 0.25), (0.25, 0.5), (0.25, 0.75), (0.75, 0.25), (0.75, 0.5), (0.75, 0.75)]
-                }
-                
-                if value in dot_positions:
-                    for pos in dot_positions[value]:
-                        x = self.x + pos[0] * self.size
-                        y = self.y + pos[1] * self.size
-                        # Draw dot with shadow effect
-                        pygame.draw.circle(surface, (30, 30, 30), (x+2, y+2), self.size // 10)
-                        pygame.draw.circle(surface, COLORS["text"], (x, y), self.size // 10)
+            # Create radial gradient for glow
+            for i in range(10):
+                alpha = 150 - i * 15
+                if alpha > 0:
+                    pygame.draw.circle(
+                        self.surface, 
+                        (*color, alpha), 
+                        (cell_x + glow_radius, glow_radius), 
+                        glow_radius - i
+                    )
+            
+            frame_size = int(glow_radius * 2)
+            self.frames.append((pygame.Rect(cell_x, 0, frame_size, frame_size), glow_radius))
+        
+        self.surface = self.surface.convert_alpha()
+        
+    def draw(self, surface, center, glow_size):
+        """Blit the glow frame closest to glow_size centered on center"""
+        k = int(round((glow_size - self.MIN_GLOW) / self.GLOW_STEP))
+        area, glow_radius = self.frames[max(0, min(k, len(self.frames) - 1))]
+        surface.blit(self.surface, (center[0] - glow_radius, center[1] - glow_radius), area)
+
+# Glow atlases shared by every token, keyed by (color, token size)
+GLOW_ATLASES = {}
+
+def get_glow_atlas(color, size):
+    """Get the shared glow atlas for a token color and size, building it on first use"""
+    key = (color, size)
+    atlas = GLOW_ATLASES.get(key)
+    if atlas is None:
+        atlas = GlowAtlas(color, size)
+        GLOW_ATLASES[key] = atlas
+    return atlas
 
 class PlayerToken:
     """Player token UI component with improved visuals"""
-    def __init__(self, player_id, color):
+    def __init__(self, player_id, color, symbol):
         self.player_id = player_id
         self.color = color
         self.position = 1
         self.visual_position = 1
         self.size = 20
-        self.offset = 10 * player_id  # Offset to prevent tokens from overlapping
+        
+        # Offset to prevent tokens from overlapping (rows of four seats)
+        self.offset = 10 * (player_id % 4)
+        self.offset_y = 10 * (player_id // 4)
         self.animation_progress = 0  # For movement animation
+        self.previous_progress = 0  # Progress at the previous logic tick
         self.is_moving = False
         self.start_pos = None
         self.target_pos = None
         self.bounce_offset = 0  # For bouncing animation
         self.glow_size = 0  # For glow effect
         self.glow_direction = 1  # 1 for increasing, -1 for decreasing
+        self.previous_glow_size = 0  # Glow size at the previous logic tick
+        self.last_bounds = None  # Area covered when last reported dirty
         
         # Token design elements
-        self.token_designs = [
-            {  # Player 1 (Human)
-                "main_color": color,
-                "highlight_color": (min(color[0] + 50, 255), min(color[1] + 50, 255), min(color[2] + 50, 255)),
-                "shadow_color": (max(color[0] - 50, 0), max(color[1] - 50, 0), max(color[2] - 50, 0)),
-                "symbol": "H"  # Human
-            },
-            {  # Player 2 (AI)
-                "main_color": color,
-                "highlight_color": (min(color[0] + 50, 255), min(color[1] + 50, 255), min(color[2] + 50, 255)),
-                "shadow_color": (max(color[0] - 50, 0), max(color[1] - 50, 0), max(color[2] - 50, 0)),
-                "symbol": "AI"  # AI
-            }
-        ]
+        self.design = {
+            "main_color": color,
+            "highlight_color": (min(color[0] + 50, 255), min(color[1] + 50, 255), min(color[2] + 50, 255)),
+            "shadow_color": (max(color[0] - 50, 0), max(color[1] - 50, 0), max(color[2] - 50, 0)),
+            "symbol": symbol  # "H" for human, "AI" for AI
+        }
         
         # Font for token symbol
-        self.font = pygame.font.SysFont(FONTS["small"], FONT_SIZES["small"], bold=True)
+        self.font = get_font("small", bold=True)
+        
+    def update(self, position, target_position, dt=LOGIC_TICK):
+        """Advance the token animation by dt seconds"""
+        # Remember the previous tick so drawing can interpolate between ticks
+        self.previous_progress = self.animation_progress
+        self.previous_glow_size = self.glow_size
         
-    def update(self, position, target_position):
-        """Update token position with animation"""
         # If position changed, start animation
         if self.position != position and not self.is_moving:
             self.position = position
             self.start_pos = self.get_interpolated_position()
             self.is_moving = True
             self.animation_progress = 0
+            self.previous_progress = 0
             
         # If target position changed, update it
         if target_position != self.visual_position:
@@ -480,7 +567,7 @@ class PlayerToken:
             
         # Update animation
         if self.is_moving:
-            self.animation_progress += 0.05  # Animation speed
+            self.animation_progress += 3.0 * dt  # Animation speed (progress per second)
             
             # Update bounce effect
             self.bounce_offset = math.sin(self.animation_progress * math.pi) * 10
@@ -489,30 +576,35 @@ class PlayerToken:
                 self.is_moving = False
                 self.bounce_offset = 0
                 
-        # Update glow effect
-        self.glow_size += 0.2 * self.glow_direction
+        # Update glow effect (glow size units per second)
+        self.glow_size += 12.0 * dt * self.glow_direction
         if self.glow_size > 5:
             self.glow_direction = -1
         elif self.glow_size < 0:
             self.glow_direction = 1
     
-    def get_interpolated_position(self):
+    def get_progress(self, alpha=1.0):
+        """Get the animation progress alpha of the way from the previous tick to the current one"""
+        return self.previous_progress + (self.animation_progress - self.previous_progress) * alpha
+        
+    def get_interpolated_position(self, alpha=1.0):
         """Get the current interpolated position for smooth movement"""
         if not self.is_moving or self.start_pos is None:
             return None
             
         # Ease-out function for smooth animation
-        t = 1 - (1 - self.animation_progress) ** 2
+        t = 1 - (1 - self.get_progress(alpha)) ** 2
         
         return t
         
-    def draw(self, surface, get_position_func):
-        """Draw the player token with improved visuals"""
+    def get_draw_position(self, get_position_func, alpha=1.0):
+        """Get the pixel position the token is drawn at this frame"""
         # Get position on board
         x, y = get_position_func(self.visual_position)
         
         # Add offset to prevent overlapping
         x += self.offset
+        y += self.offset_y
         
         # Apply animation if moving
         if self.is_moving and self.start_pos is not None:
@@ -521,33 +613,42 @@ class PlayerToken:
             target_x += self.offset
             
             # Interpolate between start and target positions
-            t = self.get_interpolated_position()
+            t = self.get_interpolated_position(alpha)
             x = x * (1 - t) + target_x * t
             
             # Apply bounce effect
-            y -= self.bounce_offset
+            y -= math.sin(self.get_progress(alpha) * math.pi) * 10
+            
+        return x, y
+        
+    def get_bounds(self, get_position_func, alpha=1.0):
+        """Get the area covered by the token, its shadow and its largest glow"""
+        x, y = self.get_draw_position(get_position_func, alpha)
+        radius = self.size + 8
+        return pygame.Rect(int(x) - radius, int(y) - radius, radius * 2, radius * 2)
+        
+    def get_dirty_rects(self, get_position_func, alpha=1.0):
+        """Get the areas that changed since the last frame"""
+        # The glow pulses every frame, so the token is always redrawn
+        bounds = self.get_bounds(get_position_func, alpha)
+        rects = [bounds]
+        if self.last_bounds is not None and self.last_bounds != bounds:
+            rects.append(self.last_bounds)
+        self.last_bounds = bounds
+        return rects
+        
+    def draw(self, surface, get_position_func, alpha=1.0):
+        """Draw the player token, interpolated alpha of the way into the current tick"""
+        x, y = self.get_draw_position(get_position_func, alpha)
         
         # Get token design
-        design = self.token_designs[self.player_id]
+        design = self.design
         
         # Draw glow effect when moving or as current player
-        if self.is_moving or self.glow_size > 0:
-            glow_radius = self.size + self.glow_size
-            glow_surface = pygame.Surface((glow_radius*2, glow_radius*2), pygame.SRCALPHA)
-            
-            # Create radial gradient for glow
-            for i in range(10):
-                alpha = 150 - i * 15
-                if alpha > 0:
-                    pygame.draw.circle(
-                        glow_surface, 
-                        (*design["highlight_color"], alpha), 
-                        (glow_radius, glow_radius), 
-                        glow_radius - i
-                    )
-            
-            # Draw glow
-            surface.blit(glow_surface, (x - glow_radius, y - glow_radius))
+        glow_size = self.previous_glow_size + (self.glow_size - self.previous_glow_size) * alpha
+        if self.is_moving or glow_size > 0:
+            atlas = get_glow_atlas(design["highlight_color"], self.size)
+            atlas.draw(surface, (x, y), glow_size)
         
         # Draw token base (3D effect)
         pygame.draw.circle(surface, design["shadow_color"], (x+2, y+2), self.size)  # Shadow
@@ -560,31 +661,40 @@ class PlayerToken:
         pygame.draw.circle(surface, COLORS["text"], (x, y), self.size, width=2)
         
         # Draw player symbol
-        text = self.font.render(design["symbol"], True, (255, 255, 255))
+        text = render_text(self.font, design["symbol"], (255, 255, 255))
         text_rect = text.get_rect(center=(x, y))
         surface.blit(text, text_rect)
 
 class Scoreboard:
     """Enhanced scoreboard UI component"""
-    def __init__(self, x, y):
+    def __init__(self, x, y, num_players=2):
         self.x = x
         self.y = y
         self.width = 180
         self.height = 150  # Adjusted height
-        self.font = pygame.font.SysFont(FONTS["text"], FONT_SIZES["text"])
-        self.font_small = pygame.font.SysFont(FONTS["small"], FONT_SIZES["small"])
-        self.font_title = pygame.font.SysFont(FONTS["subtitle"], FONT_SIZES["subtitle"], bold=True)
+        self.num_players = num_players
+        
+        # Two players get roomy rows with the last roll, more share the panel
+        self.compact = num_players > 2
+        self.row_height = (self.height - 20) // num_players if self.compact else 60
+        self.highlight_height = self.row_height if self.compact else 30
+        self.font = get_font("text")
+        self.font_small = get_font("small")
+        self.font_title = get_font("subtitle", bold=True)
         self.players = []
         self.current_player_idx = 0
         self.animation_counter = 0
-        
-        # Stats tracking
-        self.stats = {
-            "moves": [0, 0],
-            "ladders": [0, 0],
-            "snakes": [0, 0],
-            "sixes": [0, 0]
-        }
+        self.dirty = True
+        self.last_snapshot = None  # Positions and rolls shown in the last frame
+        
+        # Pre-rendered layers: the gradient panel, the pulsing highlight for
+        # each (color, alpha) and the player text (rebuilt when it changes)
+        self.background = self.render_background()
+        self.highlights = {}
+        for color in PLAYER_COLORS[:num_players]:
+            for counter in range(60):
+                self.get_highlight(color, self.get_pulse_alpha(counter))
+        self.text_layer = None
         
     def update(self, players, current_player_idx):
         """Update scoreboard with player information"""
@@ -594,14 +704,63 @@ class Scoreboard:
         # Update animation counter
         self.animation_counter = (self.animation_counter + 1) % 60
         
-    def update_stats(self, player_idx, stat_type):
-        """Update player statistics"""
-        if stat_type in self.stats and 0 <= player_idx < 2:
-            self.stats[stat_type][player_idx] += 1
-        
-    def draw(self, surface):
-        """Draw the enhanced scoreboard"""
-        # Draw scoreboard background with gradient
+        # Redraw everything when the displayed positions or rolls change
+        snapshot = (current_player_idx, tuple((p.position, p.last_roll) for p in players))
+        if snapshot != self.last_snapshot:
+            self.last_snapshot = snapshot
+            self.dirty = True
+            self.text_layer = None
+            
+    def get_rect(self):
+        """Get the screen area of the scoreboard"""
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+        
+    def get_dirty_rects(self):
+        """Get the areas that changed since the last frame"""
+        if self.dirty:
+            self.dirty = False
+            return [self.get_rect()]
+        
+        # Otherwise only the pulsing highlight behind the current player changes
+        return [self.get_highlight_rect(self.current_player_idx)]
+        
+    def get_row_top(self, i):
+        """Get the top of player i's row relative to the scoreboard"""
+        if self.compact:
+            return 10 + i * self.row_height
+        return 15 + i * self.row_height
+        
+    def get_highlight_rect(self, i):
+        """Get the screen area of the highlight behind player i"""
+        return pygame.Rect(self.x + 10, self.y + self.get_row_top(i), self.width - 20, self.highlight_height)
+            
+    def get_player_style(self, i):
+        """Get the color and name used for a player"""
+        name = "HUMAN" if self.players[i].type == PLAYER_TYPES["HUMAN"] else "AI"
+        if self.compact:
+            name = f"P{i + 1} {name}"
+        return PLAYER_COLORS[i % len(PLAYER_COLORS)], name
+        
+    def get_pulse_alpha(self, animation_counter):
+        """Get the highlight alpha for a frame of the pulse animation"""
+        pulse = abs(math.sin(animation_counter * 0.1)) * 30
+        return 100 + int(pulse)
+        
+    def get_highlight(self, color, alpha):
+        """Get the highlight surface for a color and alpha, rendering it on first use"""
+        key = (color, alpha)
+        highlight_surface = self.highlights.get(key)
+        if highlight_surface is None:
+            highlight_surface = pygame.Surface((self.width - 20, self.highlight_height), pygame.SRCALPHA)
+            pygame.draw.rect(highlight_surface, (color[0], color[1], color[2], alpha), 
+                            (0, 0, self.width - 20, self.highlight_height), 
+                            border_radius=5)
+            self.highlights[key] = highlight_surface
+        return highlight_surface
+        
+    def render_background(self):
+        """Render the gradient panel and border"""
+        background = pygame.Surface((self.width + 1, self.height))
         for i in range(self.height):
             # Calculate gradient color
             t = i / self.height
@@ -610,72 +769,69 @@ class Scoreboard:
             b = int(65 + t * 20)
             color = (r, g, b)
             
-            pygame.draw.line(surface, color, 
-                            (self.x, self.y + i), 
-                            (self.x + self.width, self.y + i))
+            pygame.draw.line(background, color, (0, i), (self.width, i))
         
         # Draw border with rounded corners
-        pygame.draw.rect(surface, COLORS["text"], 
-                        (self.x, self.y, self.width, self.height), 
+        pygame.draw.rect(background, COLORS["text"], 
+                        (0, 0, self.width, self.height), 
                         width=2, border_radius=10)
+        return background
+        
+    def render_text_layer(self):
+        """Render the player names, positions and last rolls"""
+        text_layer = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         
-        # Draw player information
         for i, player in enumerate(self.players):
-            # Determine player color and name
-            if i == 0:
-                color = COLORS["player1"]
-                name = "HUMAN"
-            else:
-                color = COLORS["player2"]
-                name = "AI"
-                
-            # Highlight current player with pulsing effect
-            if i == self.current_player_idx:
-                # Pulsing highlight
-                pulse = abs(math.sin(self.animation_counter * 0.1)) * 30
-                highlight_color = (color[0], color[1], color[2], 100 + int(pulse))
-                
-                # Draw highlight background
-                highlight_surface = pygame.Surface((self.width - 20, 30), pygame.SRCALPHA)
-                pygame.draw.rect(highlight_surface, highlight_color, 
-                                (0, 0, self.width - 20, 30), 
-                                border_radius=5)
-                surface.blit(highlight_surface, (self.x + 10, self.y + 15 + i * 60))
+            color, name = self.get_player_style(i)
+            player_text = f"{name}: Position {player.position}"
+            
+            # Compact rows only fit the name and position
+            if self.compact:
+                text = render_text(self.font_small, player_text, color)
+                text_layer.blit(text, text.get_rect(midleft=(15, self.get_row_top(i) + self.row_height // 2)))
+                continue
             
             # Draw player name and position
-            player_text = f"{name}: Position {player.position}"
-            text = self.font.render(player_text, True, color)
-            surface.blit(text, (self.x + 15, self.y + 20 + i * 60))
+            text = render_text(self.font, player_text, color)
+            text_layer.blit(text, (15, 20 + i * 60))
             
             # Draw last roll with dice icon
             if player.last_roll > 0:
                 roll_text = f"Last Roll: {player.last_roll}"
-                text = self.font_small.render(roll_text, True, color)
-                surface.blit(text, (self.x + 15, self.y + 45 + i * 60))
+                text = render_text(self.font_small, roll_text, color)
+                text_layer.blit(text, (15, 45 + i * 60))
                 
                 # Draw mini dice
                 dice_size = 15
-                dice_x = self.x + 100
-                dice_y = self.y + 45 + i * 60
-                pygame.draw.rect(surface, (255, 255, 255), 
+                dice_x = 100
+                dice_y = 45 + i * 60
+                pygame.draw.rect(text_layer, (255, 255, 255), 
                                 (dice_x, dice_y, dice_size, dice_size), 
                                 border_radius=3)
-                pygame.draw.rect(surface, color, 
+                pygame.draw.rect(text_layer, color, 
                                 (dice_x, dice_y, dice_size, dice_size), 
                                 width=1, border_radius=3)
                 
                 # Draw dots based on last roll
-                dot_positions = {
-                    1: [(0.5, 0.5)],
-                    2: [(0.25, 0.25), (0.75, 0.75)],
-                    3: [(0.25, 0.25), (0.5, 0.5), (0.75, 0.75)],
-                    4: [(0.25, 0.25), (0.25, 0.75), (0.75, 0.25), (0.75, 0.75)],
-                    5: [(0.25, 0.25), (0.25, 0.75), (0.5, 0.5), (0.75, 0.25), (0.75, 0.75)],
-                    6: [(0.25, 0.25), (0.25, 0.5), (0.25, 0.75), (0.75, 0.25), (0.75, 0.5), (0.75, 0.75)]
-                }
-                
-                if player.last_roll in dot_positions:
-                    for pos in dot_positions[player.last_roll]:
+                if player.last_roll in DICE_DOT_POSITIONS:
+                    for pos in DICE_DOT_POSITIONS[player.last_roll]:
                         x = dice_x + pos[0] * dice_size
                         y = dice_y + pos[1] * dice_size
-                        pygame.draw.circle(surface, (0, 0, 0), (x, y), dice_size // 5)
+                        pygame.draw.circle(text_layer, (0, 0, 0), (x, y), dice_size // 5)
+        
+        return text_layer
+        
+    def draw(self, surface):
+        """Draw the enhanced scoreboard"""
+        surface.blit(self.background, (self.x, self.y))
+        
+        # Highlight current player with pulsing effect
+        if 0 <= self.current_player_idx < len(self.players):
+            color, _ = self.get_player_style(self.current_player_idx)
+            highlight_surface = self.get_highlight(color, self.get_pulse_alpha(self.animation_counter))
+            surface.blit(highlight_surface, self.get_highlight_rect(self.current_player_idx))
+        
+        # Draw player information
+        if self.text_layer is None:
+            self.text_layer = self.render_text_layer()
+        surface.blit(self.text_layer, (self.x, self.y))
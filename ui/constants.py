@@ -1,7 +1,6 @@
 """
 Constants for the UI components
 """
-import pygame
 
 # Screen dimensions
 SCREEN_WIDTH = 800
@@ -33,6 +32,21 @@ COLORS = {
     "highlight": (255, 255, 0, 128),  # Semi-transparent yellow
 }
 
+# Token and scoreboard colors for each seat
+PLAYER_COLORS = [
+    COLORS["player1"],
+    COLORS["player2"],
+    (100, 180, 255),
+    (255, 200, 80),
+    (200, 120, 255),
+    (80, 220, 220),
+    (255, 140, 200),
+    (200, 200, 200),
+]
+
+# Most players shown on screen at once
+MAX_SCREEN_PLAYERS = len(PLAYER_COLORS)
+
 # Fonts
 FONT_SIZES = {
     "title": 42,
@@ -54,6 +68,9 @@ FONTS = {
 # Game settings
 FPS = 60
 ANIMATION_SPEED = 10  # Pixels per frame for animations
+LOGIC_TICK = 1 / 60  # Seconds of game time per fixed logic update
+ROLL_DELAY = 1.0  # Seconds the dice animation plays before moving
+JUMP_DELAY = 1.0  # Seconds a snake/ladder animation plays before the next turn
 
 # Player types
 PLAYER_TYPES = {
@@ -74,6 +91,7 @@ GAME_STATES = {
 ASSETS_PATH = "assets/"
 IMAGES_PATH = ASSETS_PATH + "images/"
 SOUNDS_PATH = ASSETS_PATH + "sounds/"
+ASSET_BUNDLE = "assets.bundle"  # Packed copy of the assets folder (python -m ui.bundle)
 
 # Sound effects
 SOUND_EFFECTS = {
@@ -84,6 +102,23 @@ SOUND_EFFECTS = {
     "win": "win.wav",
 }
 
+# Channel group each sound effect plays on
+SOUND_CATEGORIES = {
+    "dice_roll": "dice",
+    "move": "move",
+    "snake": "jump",
+    "ladder": "jump",
+    "win": "fanfare",
+}
+
+# Mixer channels reserved for each channel group
+SOUND_CHANNELS = {
+    "dice": 1,
+    "move": 2,
+    "jump": 2,
+    "fanfare": 1,
+}
+
 # Snakes and Ladders positions (start: end)
 # Snake positions (head: tail)
 SNAKES = {
@@ -0,0 +1,78 @@
+"""
+Shared font registry built lazily from the font settings in ui/constants.py
+"""
+import os
+import json
+import pygame
+from ui.constants import FONTS, FONT_SIZES
+
+class FontRegistry:
+    """Hands out one shared Font object per (role, bold) pair
+
+    pygame.font.SysFont scans every installed font the first time it runs,
+    which is slow on machines with many fonts. The registry resolves each
+    font name to a file path once and can keep those paths in a JSON file
+    so later starts skip the scan entirely.
+    """
+    def __init__(self, cache_path=None):
+        self.cache_path = cache_path
+        self.fonts = {}
+        self.paths = None  # Resolved font paths, loaded on first use
+
+    def get_font(self, role, bold=False):
+        """Get the shared font for a role in FONTS/FONT_SIZES"""
+        key = (role, bold)
+        font = self.fonts.get(key)
+        if font is None:
+            path, synthetic_bold = self.resolve(FONTS[role], bold)
+            font = pygame.font.Font(path, FONT_SIZES[role])
+            if synthetic_bold:
+                font.set_bold(True)
+            self.fonts[key] = font
+        return font
+
+    def resolve(self, name, bold):
+        """Get the file path for a font name and whether bold must be synthesized"""
+        if self.paths is None:
+            self.paths = self.load_cache()
+
+        key = f"{name}|{'bold' if bold else 'regular'}"
+        entry = self.paths.get(key)
+        if entry is not None and (entry[0] is None or os.path.exists(entry[0])):
+            return entry[0], entry[1]
+
+        # Scan the system fonts (the slow path) and remember the answer
+        path = pygame.font.match_font(name, bold=bold)
+        synthetic_bold = bold and (path is None or path == pygame.font.match_font(name))
+        self.paths[key] = [path, synthetic_bold]
+        self.save_cache()
+        return path, synthetic_bold
+
+    def load_cache(self):
+        """Load resolved font paths from the on-disk cache"""
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            print("Warning: Could not read font cache. Resolving fonts again.")
+            return {}
+
+    def save_cache(self):
+        """Write resolved font paths to the on-disk cache"""
+        if not self.cache_path:
+            return
+        try:
+            with open(self.cache_path, "w") as f:
+                json.dump(self.paths, f, indent=2)
+        except OSError:
+            print("Warning: Could not write font cache.")
+
+# Registry shared by every UI component (set SNAKES_FONT_CACHE to a file
+# path to keep resolved font paths between runs)
+FONT_REGISTRY = FontRegistry(os.environ.get("SNAKES_FONT_CACHE"))
+
+def get_font(role, bold=False):
+    """Get a shared font from the registry"""
+    return FONT_REGISTRY.get_font(role, bold)
@@ -0,0 +1,146 @@
+"""
+Board geometry for snakes and ladders, computed once per board
+
+Nothing here depends on pygame, so replay and export tools can reuse the
+same point lists the game draws with.
+"""
+import math
+import random
+from ui.constants import BOARD_SIZE, BOARD_MARGIN, SQUARE_SIZE
+
+def square_center(square_number, left=BOARD_MARGIN, top=BOARD_MARGIN, square_size=SQUARE_SIZE, size=BOARD_SIZE):
+    """Get the pixel position of the center of a square on the board"""
+    if square_number < 1 or square_number > size * size:
+        return (0, 0)
+
+    # Row 0 is drawn at the top, so the first row of squares is the last row on screen
+    row = size - 1 - (square_number - 1) // size
+
+    # Rows alternate direction, with the bottom row running left to right
+    if (size - 1 - row) % 2 == 0:
+        col = (square_number - 1) % size
+    else:
+        col = size - 1 - (square_number - 1) % size
+
+    x = left + col * square_size + square_size // 2
+    y = top + row * square_size + square_size // 2
+    return (x, y)
+
+class BoardGeometry:
+    """Snake curves and ladder rails for one board layout"""
+    def __init__(self, layout, left=BOARD_MARGIN, top=BOARD_MARGIN, square_size=SQUARE_SIZE, seed=None):
+        self.layout = layout
+        self.left = left
+        self.top = top
+        self.square_size = square_size
+        self.seed = layout.seed if seed is None else seed
+
+        # Private RNG so the curves are identical across runs and never touch
+        # the global random module
+        rng = random.Random(self.seed)
+
+        self.snakes = {}
+        for head in sorted(layout.snakes):
+            self.snakes[head] = self.build_snake(head, layout.snakes[head], rng)
+
+        self.ladders = {}
+        for bottom in sorted(layout.ladders):
+            self.ladders[bottom] = self.build_ladder(bottom, layout.ladders[bottom])
+
+    def square_center(self, square_number):
+        """Get the pixel position of the center of a square"""
+        return square_center(square_number, self.left, self.top, self.square_size, self.layout.size)
+
+    def build_snake(self, head, tail, rng):
+        """Compute the Bezier body of a snake and its segment colors"""
+        head_pos = self.square_center(head)
+        tail_pos = self.square_center(tail)
+
+        # Offset the control point so each snake gets its own curve
+        control_point = (
+            (head_pos[0] + tail_pos[0]) // 2 + rng.randint(-50, 50),
+            (head_pos[1] + tail_pos[1]) // 2 + rng.randint(-50, 50)
+        )
+
+        # Sample a quadratic bezier curve
+        points = []
+        for t in range(0, 101, 5):
+            t = t / 100
+            x = (1 - t) ** 2 * head_pos[0] + 2 * (1 - t) * t * control_point[0] + t ** 2 * tail_pos[0]
+            y = (1 - t) ** 2 * head_pos[1] + 2 * (1 - t) * t * control_point[1] + t ** 2 * tail_pos[1]
+            points.append((int(x), int(y)))
+
+        # Gradient color for each segment, fading from head to tail
+        colors = []
+        for i in range(len(points) - 1):
+            t = i / (len(points) - 1)
+            colors.append((int(255 - t * 100), int(80 - t * 40), int(80 - t * 40)))
+
+        return {
+            "head": head_pos,
+            "tail": tail_pos,
+            "control": control_point,
+            "points": points,
+            "colors": colors,
+            "scales": points[1:-1:2]
+        }
+
+    def build_ladder(self, bottom, top):
+        """Compute the rail segments and rungs of a ladder"""
+        bottom_pos = self.square_center(bottom)
+        top_pos = self.square_center(top)
+
+        dx = top_pos[0] - bottom_pos[0]
+        dy = top_pos[1] - bottom_pos[1]
+        length = math.sqrt(dx ** 2 + dy ** 2)
+
+        ladder = {
+            "bottom": bottom_pos,
+            "top": top_pos,
+            "angle": math.degrees(math.atan2(dy, dx)),
+            "length": length,
+            "rails": [],
+            "rungs": []
+        }
+        if length == 0:
+            return ladder
+
+        # Perpendicular offset for the two rails
+        offset_x = -dy * 8 / length
+        offset_y = dx * 8 / length
+
+        # Rail segments with a gold to light gold gradient
+        for i in range(100):
+            t = i / 99
+            x1 = bottom_pos[0] + dx * t
+            y1 = bottom_pos[1] + dy * t
+            x2 = bottom_pos[0] + dx * (t + 0.01)
+            y2 = bottom_pos[1] + dy * (t + 0.01)
+            color = (int(180 + t * 75), int(140 + t * 60), int(20 + t * 40))
+            ladder["rails"].append((
+                color,
+                (x1 - offset_x, y1 - offset_y), (x2 - offset_x, y2 - offset_y),
+                (x1 + offset_x, y1 + offset_y), (x2 + offset_x, y2 + offset_y)
+            ))
+
+        # Rungs spaced evenly along the ladder
+        num_rungs = max(3, int(length / 40))
+        for i in range(num_rungs):
+            t = (i + 0.5) / num_rungs
+            ladder["rungs"].append((
+                (bottom_pos[0] + dx * t - offset_x, bottom_pos[1] + dy * t - offset_y),
+                (bottom_pos[0] + dx * t + offset_x, bottom_pos[1] + dy * t + offset_y)
+            ))
+
+        return ladder
+
+# Geometry by (layout, left, top, square_size), shared by every Board
+GEOMETRY_CACHE = {}
+
+def get_board_geometry(layout, left=BOARD_MARGIN, top=BOARD_MARGIN, square_size=SQUARE_SIZE):
+    """Get the geometry for a layout, computing it only the first time"""
+    key = (layout, left, top, square_size)
+    geometry = GEOMETRY_CACHE.get(key)
+    if geometry is None:
+        geometry = GEOMETRY_CACHE[key] = BoardGeometry(layout, left, top, square_size)
+    return geometry
@@ -0,0 +1,160 @@
+"""
+Frame-time profiler with an on-screen overlay and JSON/CSV export
+"""
+import csv
+import json
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+import pygame
+from ui.constants import COLORS
+from ui.fonts import get_font
+
+def percentile(sorted_samples, fraction):
+    """Get a percentile from an already sorted list of samples"""
+    if not sorted_samples:
+        return 0.0
+    index = min(int(fraction * len(sorted_samples)), len(sorted_samples) - 1)
+    return sorted_samples[index]
+
+class FrameProfiler:
+    """Times each stage of the main loop over a rolling window of frames
+
+    Stages are timed with stage() around blocks of the main loop, or by
+    wrapping a component method with instrument(). When the profiler is
+    disabled both are no-ops.
+    """
+    def __init__(self, enabled=False, window=600, refresh_frames=30):
+        self.enabled = enabled
+        self.window = window
+        self.refresh_frames = refresh_frames
+        self.samples = {}  # Stage name -> recent durations in milliseconds
+        self.totals = {}  # Stage name -> [count, total milliseconds]
+        self.frames = 0
+        self.overlay = None
+        self.overlay_pos = (5, 5)
+        self.overlay_rect = None  # Area covered by the last overlay drawn
+        self.null_stage = nullcontext()
+
+    def record(self, name, seconds):
+        """Record one duration for a stage"""
+        milliseconds = seconds * 1000
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = deque(maxlen=self.window)
+            self.totals[name] = [0, 0.0]
+        samples.append(milliseconds)
+        totals = self.totals[name]
+        totals[0] += 1
+        totals[1] += milliseconds
+
+    def stage(self, name):
+        """Context manager that times a block of code as a stage"""
+        if not self.enabled:
+            return self.null_stage
+        return self.timed_stage(name)
+
+    @contextmanager
+    def timed_stage(self, name):
+        """Time a block of code and record it under name"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def instrument(self, obj, method_name, stage_name):
+        """Wrap a method on obj so every call is recorded as a stage"""
+        if not self.enabled:
+            return
+        method = getattr(obj, method_name)
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.record(stage_name, time.perf_counter() - start)
+
+        setattr(obj, method_name, timed)
+
+    def end_frame(self):
+        """Mark the end of a frame, refreshing the overlay every few frames"""
+        if not self.enabled:
+            return
+        self.frames += 1
+        if self.frames % self.refresh_frames == 0:
+            self.overlay = None
+
+    def get_stats(self):
+        """Get count, mean and rolling p50/p95/p99/max in milliseconds per stage"""
+        stats = {}
+        for name, samples in self.samples.items():
+            recent = sorted(samples)
+            count, total = self.totals[name]
+            stats[name] = {
+                "count": count,
+                "mean": total / count,
+                "p50": percentile(recent, 0.50),
+                "p95": percentile(recent, 0.95),
+                "p99": percentile(recent, 0.99),
+                "max": recent[-1]
+            }
+        return stats
+
+    def render_overlay(self):
+        """Render the stats table into a semi-transparent overlay surface"""
+        font = get_font("small")
+        rows = [("stage (ms)", "p50", "p95", "p99")]
+        for name, stat in self.get_stats().items():
+            rows.append((name, f"{stat['p50']:.2f}", f"{stat['p95']:.2f}", f"{stat['p99']:.2f}"))
+
+        # Stage names are left aligned, the numbers right aligned in columns
+        line_height = font.get_linesize()
+        name_width = max(font.size(row[0])[0] for row in rows) + 10
+        column_width = max(font.size(value)[0] for row in rows for value in row[1:]) + 10
+        width = name_width + column_width * 3 + 10
+        overlay = pygame.Surface((width, line_height * len(rows) + 10), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 180))
+
+        # Overlay text changes every refresh, so it bypasses the shared text cache
+        for i, row in enumerate(rows):
+            y = 5 + i * line_height
+            overlay.blit(font.render(row[0], True, COLORS["text"]), (5, y))
+            for j, value in enumerate(row[1:]):
+                text = font.render(value, True, COLORS["text"])
+                overlay.blit(text, text.get_rect(topright=(5 + name_width + column_width * (j + 1), y)))
+        return overlay
+
+    def get_dirty_rects(self):
+        """Get the old and new overlay areas when the overlay is refreshed"""
+        if not self.enabled or not self.samples or self.overlay is not None:
+            return []
+        self.overlay = self.render_overlay()
+        rects = [self.overlay.get_rect(topleft=self.overlay_pos)]
+        if self.overlay_rect is not None:
+            rects.append(self.overlay_rect)
+        return rects
+
+    def draw_overlay(self, surface):
+        """Draw the stats overlay in the top-left corner"""
+        if not self.enabled or not self.samples:
+            return
+        if self.overlay is None:
+            self.overlay = self.render_overlay()
+        surface.blit(self.overlay, self.overlay_pos)
+        self.overlay_rect = self.overlay.get_rect(topleft=self.overlay_pos)
+
+    def export(self, path):
+        """Write the stage stats to a .csv file, or JSON for any other extension"""
+        stats = self.get_stats()
+        if path.endswith(".csv"):
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["stage", "count", "mean", "p50", "p95", "p99", "max"])
+                for name, stat in stats.items():
+                    writer.writerow([name, stat["count"], stat["mean"], stat["p50"],
+                                     stat["p95"], stat["p99"], stat["max"]])
+        else:
+            with open(path, "w") as f:
+                json.dump({"frames": self.frames, "stages": stats}, f, indent=2)
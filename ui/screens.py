@@ -1,30 +1,56 @@
 """
 Screen classes for the game UI
 """
+import os
 import pygame
-from ui.constants import SCREEN_WIDTH, SCREEN_HEIGHT, COLORS, FONT_SIZES, FONTS
+from ui.constants import SCREEN_WIDTH, SCREEN_HEIGHT, COLORS, LOGIC_TICK, PLAYER_COLORS, PLAYER_TYPES
 from ui.components import Button, Board, Dice, PlayerToken, Scoreboard
+from ui.text_cache import render_text
+from ui.fonts import get_font
+from ui.audio import AUDIO
+from game.board import JUMP_SNAKE, JUMP_LADDER, BOARDS_DIR, load_board, list_boards
 
 class Screen:
     """Base class for all screens"""
     def __init__(self, surface):
         self.surface = surface
-        self.font_title = pygame.font.SysFont(FONTS["title"], FONT_SIZES["title"], bold=True)
-        self.font_subtitle = pygame.font.SysFont(FONTS["subtitle"], FONT_SIZES["subtitle"], bold=True)
-        self.font_text = pygame.font.SysFont(FONTS["text"], FONT_SIZES["text"])
-        self.font_small = pygame.font.SysFont(FONTS["small"], FONT_SIZES["small"])
+        self.font_title = get_font("title", bold=True)
+        self.font_subtitle = get_font("subtitle", bold=True)
+        self.font_text = get_font("text")
+        self.font_small = get_font("small")
+        self.full_redraw = True
+        self.render_alpha = 1.0  # How far drawing is between the last two logic ticks
         
     def handle_event(self, event):
         """Handle events for the screen"""
         pass
         
-    def update(self):
-        """Update the screen"""
+    def invalidate(self):
+        """Redraw the whole screen on the next frame"""
+        self.full_redraw = True
+        
+    def get_dirty_rects(self):
+        """Get the areas that changed since the last frame and need redrawing"""
+        if self.full_redraw:
+            self.full_redraw = False
+            return [self.surface.get_rect()]
+        return []
+        
+    def update(self, dt=LOGIC_TICK):
+        """Advance the screen by one logic tick of dt seconds"""
         pass
         
+    def set_render_alpha(self, alpha):
+        """Set how far between the last two logic ticks the next draw should be"""
+        self.render_alpha = alpha
+        
     def draw(self):
         """Draw the screen"""
         pass
+        
+    def draw_region(self, rect):
+        """Redraw the parts of the screen inside rect (the surface is clipped to it)"""
+        self.draw()
 
 class WelcomeScreen(Screen):
     """Welcome screen with game options"""
@@ -54,15 +80,19 @@ class WelcomeScreen(Screen):
                 return "start_game"
         return None
         
-    def update(self):
+    def update(self, dt=LOGIC_TICK):
         """Update the welcome screen"""
         mouse_pos = pygame.mouse.get_pos()
         self.start_button.update(mouse_pos)
         
+    def get_dirty_rects(self):
+        """Get the areas that changed since the last frame and need redrawing"""
+        return super().get_dirty_rects() + self.start_button.get_dirty_rects()
+        
     def draw(self):
         """Draw the welcome screen"""
         # Draw title
-        title_text = self.font_title.render("Modern Snakes and Ladders", True, COLORS["text"])
+        title_text = render_text(self.font_title, "Modern Snakes and Ladders", COLORS["text"])
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 100))
         self.surface.blit(title_text, title_rect)
         
@@ -75,11 +105,11 @@ class WelcomeScreen(Screen):
             "1. Roll the dice to move your token",
             "2. Land on a ladder to climb up",
             "3. Land on a snake to slide down",
-            "4. First player to reach 100 wins!"
+            "4. First player to reach the last square wins!"
         ]
         
         for i, line in enumerate(instructions):
-            text = self.font_text.render(line, True, COLORS["text"])
+            text = render_text(self.font_text, line, COLORS["text"])
             rect = text.get_rect(center=(SCREEN_WIDTH // 2, 420 + i * 25))
             self.surface.blit(text, rect)
     
@@ -89,18 +119,20 @@ class WelcomeScreen(Screen):
 
 class GameScreen(Screen):
     """Main game screen"""
-    def __init__(self, surface, game_manager):
+    def __init__(self, surface, game_manager, boards_dir=BOARDS_DIR):
         super().__init__(surface)
         self.game_manager = game_manager
+        self.boards_dir = boards_dir
         
         # Create game components
-        self.board = Board(surface)
+        self.board = Board(surface, game_manager.board)
         self.dice = Dice(650, 200)
         self.player_tokens = [
-            PlayerToken(0, COLORS["player1"]),
-            PlayerToken(1, COLORS["player2"])
+            PlayerToken(player.id, PLAYER_COLORS[player.id % len(PLAYER_COLORS)], self.get_token_symbol(player))
+            for player in game_manager.players
         ]
-        self.scoreboard = Scoreboard(600, 350)
+        self.scoreboard = Scoreboard(600, 350, len(game_manager.players))
+        self.turn_text_key = None  # Player shown in the turn indicator last frame
         
         # Create buttons
         self.roll_button = Button(
@@ -119,22 +151,16 @@ class GameScreen(Screen):
             COLORS["button_text"]
         )
         
-        # Load sounds
-        self.sounds = {}
-        try:
-            self.sounds["dice_roll"] = pygame.mixer.Sound("assets/sounds/dice_roll.wav")
-            self.sounds["move"] = pygame.mixer.Sound("assets/sounds/move.wav")
-            self.sounds["snake"] = pygame.mixer.Sound("assets/sounds/snake.wav")
-            self.sounds["ladder"] = pygame.mixer.Sound("assets/sounds/ladder.wav")
-            self.sounds["win"] = pygame.mixer.Sound("assets/sounds/win.wav")
-        except:
-            print("Warning: Could not load sound files. Using placeholder sounds.")
-            # Create placeholder sounds
-            self.sounds["dice_roll"] = pygame.mixer.Sound(buffer=bytes([0]))
-            self.sounds["move"] = pygame.mixer.Sound(buffer=bytes([0]))
-            self.sounds["snake"] = pygame.mixer.Sound(buffer=bytes([0]))
-            self.sounds["ladder"] = pygame.mixer.Sound(buffer=bytes([0]))
-            self.sounds["win"] = pygame.mixer.Sound(buffer=bytes([0]))
+        # Sounds load in the background and play as placeholder tones until ready
+        AUDIO.load()
+        
+    def get_token_symbol(self, player):
+        """Get the symbol drawn on a player's token"""
+        return "H" if player.type == PLAYER_TYPES["HUMAN"] else "AI"
+        
+    def play_sound(self, name):
+        """Play one of the game sound effects"""
+        AUDIO.play(name)
         
     def handle_event(self, event):
         """Handle events for the game screen"""
@@ -144,7 +170,7 @@ class GameScreen(Screen):
                 current_player = self.game_manager.get_current_player()
                 if current_player.type == 0 and self.game_manager.game_state == 0:
                     self.game_manager.roll_dice()
-                    self.sounds["dice_roll"].play()
+                    self.play_sound("dice_roll")
                 return None
             elif self.menu_button.is_clicked(event.pos):
                 return "main_menu"
@@ -154,46 +180,78 @@ class GameScreen(Screen):
                 current_player = self.game_manager.get_current_player()
                 if current_player.type == 0 and self.game_manager.game_state == 0:
                     self.game_manager.roll_dice()
-                    self.sounds["dice_roll"].play()
+                    self.play_sound("dice_roll")
+                return None
+            elif event.key == pygame.K_b:
+                # B switches to the next board file and starts a new game
+                self.next_board()
                 return None
         
         # Check if game is over
         if self.game_manager.game_state == 4:  # GAME_OVER
-            self.sounds["win"].play()
+            self.play_sound("win")
             return "game_over"
             
         return None
         
-    def update(self):
+    def set_board(self, layout):
+        """Start a new game on a different board layout"""
+        self.game_manager.set_board(layout)
+        self.board.set_layout(layout)
+        self.invalidate()
+        
+    def next_board(self):
+        """Load the board file after the current one in the boards directory
+        
+        The directory is re-read each time, so new or edited boards are
+        picked up without restarting. Invalid files are reported and skipped.
+        """
+        paths = list_boards(self.boards_dir)
+        current = self.game_manager.board.path
+        absolute = [os.path.abspath(path) for path in paths]
+        start = absolute.index(current) + 1 if current in absolute else 0
+        
+        for i in range(len(paths)):
+            path = paths[(start + i) % len(paths)]
+            try:
+                layout = load_board(path)
+            except ValueError as e:
+                print(f"Warning: Skipping board {path}: {e}")
+                continue
+            self.set_board(layout)
+            return layout
+        return None
+        
+    def update(self, dt=LOGIC_TICK):
         """Update the game screen"""
         # Update game manager
-        self.game_manager.update()
+        self.game_manager.update(dt)
+        
+        # Pick up board images that finished loading
+        self.board.update()
         
         # Update dice animation
         current_player = self.game_manager.get_current_player()
         self.dice.update(current_player.last_roll)
         
         # Update player tokens
+        jump_types = self.game_manager.board.jump_type
         for player in self.game_manager.players:
-            self.player_tokens[player.id].update(player.position, player.target_position)
+            token = self.player_tokens[player.id]
+            token.update(player.position, player.target_position, dt)
+            
+            # Seats change hands on reset (every seat is AI in replay playback)
+            token.design["symbol"] = self.get_token_symbol(player)
             
             # Play sound effects for movement
             if player.is_moving:
-                from ui.constants import SNAKES, LADDERS
-                if player.position in SNAKES:
-                    self.sounds["snake"].play()
-                    self.scoreboard.update_stats(player.id, "snakes")
-                elif player.position in LADDERS:
-                    self.sounds["ladder"].play()
-                    self.scoreboard.update_stats(player.id, "ladders")
+                jump_type = jump_types[player.position]
+                if jump_type == JUMP_SNAKE:
+                    self.play_sound("snake")
+                elif jump_type == JUMP_LADDER:
+                    self.play_sound("ladder")
                 else:
-                    self.sounds["move"].play()
-                    self.scoreboard.update_stats(player.id, "moves")
-                    
-                    # Track sixes
-                    if player.last_roll == 6:
-                        self.scoreboard.update_stats(player.id, "sixes")
-                        
+                    self.play_sound("move")
                 player.is_moving = False
         
         # Update buttons
@@ -204,6 +262,29 @@ class GameScreen(Screen):
         # Update scoreboard
         self.scoreboard.update(self.game_manager.players, self.game_manager.current_player_idx)
         
+    def get_dirty_rects(self):
+        """Get the areas that changed since the last frame and need redrawing"""
+        rects = super().get_dirty_rects()
+        rects += self.board.get_dirty_rects()
+        for token in self.player_tokens:
+            rects += token.get_dirty_rects(self.board.get_square_position, self.render_alpha)
+        rects += self.dice.get_dirty_rects()
+        rects += self.scoreboard.get_dirty_rects()
+        rects += self.roll_button.get_dirty_rects()
+        rects += self.menu_button.get_dirty_rects()
+        
+        # Turn indicator text
+        current_player = self.game_manager.get_current_player()
+        turn_text_key = (current_player.id, current_player.type)
+        if turn_text_key != self.turn_text_key:
+            self.turn_text_key = turn_text_key
+            rects.append(self.get_turn_text_rect())
+        return rects
+        
+    def get_turn_text_rect(self):
+        """Get the screen area of the current player indicator"""
+        return pygame.Rect(600, 100, SCREEN_WIDTH - 600, self.font_text.get_linesize())
+        
     def draw(self):
         """Draw the game screen"""
         # Draw board
@@ -211,7 +292,7 @@ class GameScreen(Screen):
         
         # Draw player tokens
         for token in self.player_tokens:
-            token.draw(self.surface, self.board.get_square_position)
+            token.draw(self.surface, self.board.get_square_position, self.render_alpha)
         
         # Draw dice
         self.dice.draw(self.surface)
@@ -223,12 +304,39 @@ class GameScreen(Screen):
         self.roll_button.draw(self.surface)
         self.menu_button.draw(self.surface)
         
+        self.draw_turn_text()
+        
+    def draw_region(self, rect):
+        """Redraw only the components that overlap rect
+        
+        Token glow and the scoreboard pulse change every frame, so most
+        frames only touch a few small rects and each one should cost just
+        the blits that land inside it.
+        """
+        surface = self.surface
+        if rect.colliderect(self.board.bounds):
+            self.board.draw(surface)
+        for token in self.player_tokens:
+            if token.last_bounds is None or rect.colliderect(token.last_bounds):
+                token.draw(surface, self.board.get_square_position, self.render_alpha)
+        if rect.colliderect(self.dice.bounds):
+            self.dice.draw(surface)
+        if rect.colliderect(self.scoreboard.get_rect()):
+            self.scoreboard.draw(surface)
+        for button in (self.roll_button, self.menu_button):
+            if rect.colliderect(button.rect):
+                button.draw(surface)
+        if rect.colliderect(self.get_turn_text_rect()):
+            self.draw_turn_text()
+        
+    def draw_turn_text(self):
+        """Draw the current player indicator"""
         # Draw current player indicator with proper margins
         current_player = self.game_manager.get_current_player()
         player_text = f"Player {current_player.id + 1}'s Turn"
         if current_player.type == 1:  # AI
             player_text += " (AI)"
-        text = self.font_text.render(player_text, True, COLORS["text"])
+        text = render_text(self.font_text, player_text, COLORS["text"])
         # Position text with proper margins to ensure it's not cut off
         self.surface.blit(text, (600, 100))
 
@@ -272,22 +380,29 @@ class GameOverScreen(Screen):
                 return "main_menu"
         return None
         
-    def update(self):
+    def update(self, dt=LOGIC_TICK):
         """Update the game over screen"""
         mouse_pos = pygame.mouse.get_pos()
         self.play_again_button.update(mouse_pos)
         self.main_menu_button.update(mouse_pos)
         
+    def get_dirty_rects(self):
+        """Get the areas that changed since the last frame and need redrawing"""
+        rects = super().get_dirty_rects()
+        rects += self.play_again_button.get_dirty_rects()
+        rects += self.main_menu_button.get_dirty_rects()
+        return rects
+        
     def draw(self):
         """Draw the game over screen"""
         # Draw title
-        title_text = self.font_title.render("Game Over", True, COLORS["text"])
+        title_text = render_text(self.font_title, "Game Over", COLORS["text"])
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 100))
         self.surface.blit(title_text, title_rect)
         
         # Draw winner
         if self.winner is not None:
-            winner_text = self.font_subtitle.render(f"Player {self.winner + 1} Wins!", True, COLORS["text"])
+            winner_text = render_text(self.font_subtitle, f"Player {self.winner + 1} Wins!", COLORS["text"])
             winner_rect = winner_text.get_rect(center=(SCREEN_WIDTH // 2, 200))
             self.surface.blit(winner_text, winner_rect)
         
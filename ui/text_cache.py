@@ -0,0 +1,55 @@
+"""
+Shared cache of rendered text surfaces
+"""
+from collections import OrderedDict
+
+class TextCache:
+    """LRU cache of surfaces returned by Font.render
+
+    Surfaces are keyed by (font, text, color, antialias) and shared between
+    callers, so they must be treated as read-only.
+    """
+    def __init__(self, max_size=512):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        """Get a rendered text surface, rendering it only on a cache miss"""
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+
+        # Evict the least recently used surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Drop every cached surface and reset the counters"""
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_stats(self):
+        """Get the cache size and hit/miss counters"""
+        return {
+            "size": len(self.surfaces),
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+# Cache shared by every UI component
+TEXT_CACHE = TextCache()
+
+def render_text(font, text, color, antialias=True):
+    """Render text through the shared cache"""
+    return TEXT_CACHE.render(font, text, color, antialias)